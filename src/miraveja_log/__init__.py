@@ -4,8 +4,8 @@ miraveja-log: Lightweight and flexible logging library with structured logging s
 Public API exports for the miraveja-log package.
 """
 
-# Application exports
-from miraveja_log.application import LoggerConfig, LoggerFactory
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 # Domain exports
 from miraveja_log.domain import (
@@ -18,8 +18,18 @@ from miraveja_log.domain import (
     OutputTarget,
 )
 
+if TYPE_CHECKING:
+    # Application exports
+    from miraveja_log.application import LoggerConfig, LoggerFactory
+
 __version__ = "0.1.0"
 
+# Application exports are loaded on first access so importing the package stays cheap
+_LAZY_EXPORTS: dict[str, str] = {
+    "LoggerFactory": "miraveja_log.application",
+    "LoggerConfig": "miraveja_log.application",
+}
+
 __all__: list[str] = [
     # Factory
     "LoggerFactory",
@@ -36,3 +46,17 @@ __all__: list[str] = [
     "ConfigurationException",
     "HandlerException",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported symbols on first access (PEP 562)."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily exported symbols."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -8,7 +8,7 @@ Depends only on the Domain layer.
 from .configuration import LoggerConfig
 from .logger_factory import LoggerFactory
 
-__all__ = [
+__all__: list[str] = [
     "LoggerFactory",
     "LoggerConfig",
 ]
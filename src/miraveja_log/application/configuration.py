@@ -1,48 +1,70 @@
 import os
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing import Any, Dict, FrozenSet, Optional, Union
 
 from miraveja_log.domain import LogLevel, OutputTarget
 
-
-class LoggerConfig(BaseModel):
-    """Configuration settings for the logger."""
-
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    name: str = Field(..., description="The name of the logger.")
-    level: LogLevel = Field(default=LogLevel.DEBUG, description="The logging level.")
-    output_target: OutputTarget = Field(default=OutputTarget.CONSOLE, description="The output target for the logger.")
-    log_format: Optional[str] = Field(
-        default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        description="The format string for log messages.",
-    )
-    date_format: Optional[str] = Field(
-        default="%Y-%m-%d %H:%M:%S", description="The format string for timestamps in log messages."
-    )
-    directory: Optional[Path] = Field(
-        default=None, description="The directory where log files will be stored if output_target is FILE or JSON."
-    )
-    filename: Optional[str] = Field(
-        default=None, description="The filename for the log file if output_target is FILE or JSON."
-    )
-
-    @field_validator("directory", mode="before")
-    def validate_directory(cls, v: Optional[str]) -> Optional[Path]:
-        """Convert directory string to Path if provided."""
-        return Path(v) if v is not None else None
-
-    @model_validator(mode="after")
-    def validate_file_target_requirements(self) -> "LoggerConfig":
-        """Validate that directory and filename are provided when output_target is FILE or JSON."""
-        if self.output_target in {OutputTarget.FILE, OutputTarget.JSON}:
+# Targets that write to a file and therefore need a directory and filename; built once, not per check
+_FILE_TARGETS: FrozenSet[OutputTarget] = frozenset({OutputTarget.FILE, OutputTarget.JSON})
+
+
+@dataclass(frozen=True, slots=True)
+class LoggerConfig:  # pylint: disable=too-many-instance-attributes
+    """
+    Configuration settings for the logger.
+
+    Attributes:
+        name: The name of the logger.
+        level: The logging level.
+        output_target: The output target for the logger.
+        log_format: The format string for log messages.
+        date_format: The format string for timestamps in log messages.
+        directory: The directory where log files will be stored if output_target is FILE or JSON.
+        filename: The filename for the log file if output_target is FILE or JSON.
+        buffer_capacity: The size in bytes of the write buffer used for FILE and JSON targets; 1 writes each
+            record through to the file as it is logged.
+        flush_interval_ms: The interval in milliseconds between buffer flushes (0 disables them).
+        use_queue: Whether synchronous loggers hand records to a background thread instead of writing
+            them on the calling thread. Async loggers always do.
+        flush_on_sigterm: Whether FILE and JSON buffers are flushed when the process receives SIGTERM. Enabling
+            it installs a process-wide SIGTERM handler, unless the application has already set one.
+    """
+
+    name: str
+    level: LogLevel = LogLevel.DEBUG
+    output_target: OutputTarget = OutputTarget.CONSOLE
+    log_format: Optional[str] = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    date_format: Optional[str] = "%Y-%m-%d %H:%M:%S"
+    directory: Optional[Union[Path, str]] = None
+    filename: Optional[str] = None
+    buffer_capacity: int = 65536
+    flush_interval_ms: int = 200
+    use_queue: bool = False
+    flush_on_sigterm: bool = False
+
+    def __post_init__(self) -> None:
+        """Normalize field types and validate that file targets have a directory and filename."""
+        # Instances are frozen, so normalized values are written with object.__setattr__
+        object.__setattr__(self, "level", LogLevel(self.level))
+        object.__setattr__(self, "output_target", OutputTarget(self.output_target))
+        if self.directory is not None:
+            object.__setattr__(self, "directory", Path(self.directory))
+
+        if self.output_target in _FILE_TARGETS:
             if self.directory is None:
                 raise ValueError(f"directory must be provided when output_target is {self.output_target}.")
             if self.filename is None:
                 raise ValueError(f"filename must be provided when output_target is {self.output_target}.")
-        return self
+        if self.buffer_capacity <= 0:
+            raise ValueError("buffer_capacity must be greater than 0.")
+        if self.flush_interval_ms < 0:
+            raise ValueError("flush_interval_ms must be greater than or equal to 0.")
+
+        # Interned names let factory cache and logging manager lookups match by identity
+        if type(self.name) is str:  # pylint: disable=unidiomatic-typecheck
+            object.__setattr__(self, "name", sys.intern(self.name))
 
     @classmethod
     def from_env(cls) -> "LoggerConfig":
@@ -58,45 +80,29 @@ class LoggerConfig(BaseModel):
         - LOGGER_DIR: Log directory
         - LOGGER_FILENAME: Log filename
         """
-        name = os.getenv("LOGGER_NAME", "default_name")
+        env = os.environ
         # Treat empty strings as not set
-        if not name:
-            name = "default_name"
-
-        config = cls(
-            name=name,
-        )
-
-        level_str = os.getenv("LOGGER_LEVEL")
-        if level_str:
-            config.level = LogLevel(level_str)
-
-        target_str = os.getenv("LOGGER_TARGET")
-        if target_str:
-            config.output_target = OutputTarget(target_str)
-
-        format_str = os.getenv("LOGGER_FORMAT")
-        if format_str:
-            config.log_format = format_str
-
-        datefmt_str = os.getenv("LOGGER_DATEFMT")
-        if datefmt_str:
-            config.date_format = datefmt_str
-
-        dir_str = os.getenv("LOGGER_DIR")
-        if dir_str:
+        kwargs: Dict[str, Any] = {"name": env.get("LOGGER_NAME") or "default_name"}
+
+        if level_str := env.get("LOGGER_LEVEL"):
+            kwargs["level"] = LogLevel(level_str)
+        if target_str := env.get("LOGGER_TARGET"):
+            kwargs["output_target"] = OutputTarget(target_str)
+        if format_str := env.get("LOGGER_FORMAT"):
+            kwargs["log_format"] = format_str
+        if datefmt_str := env.get("LOGGER_DATEFMT"):
+            kwargs["date_format"] = datefmt_str
+        if dir_str := env.get("LOGGER_DIR"):
             # Convert relative paths to absolute
-            config.directory = Path(dir_str).resolve()
-
-        filename_str = os.getenv("LOGGER_FILENAME")
-        if filename_str:
-            config.filename = filename_str
+            kwargs["directory"] = Path(dir_str).resolve()
+        if filename_str := env.get("LOGGER_FILENAME"):
+            kwargs["filename"] = filename_str
 
-        # Reconstruct the model to ensure all validations are applied
-        return cls(**config.model_dump())
+        # Construct once so validation runs against the complete configuration
+        return cls(**kwargs)
 
     def get_full_path(self) -> Optional[Path]:
         """Get the full path to the log file if applicable."""
-        if self.output_target in {OutputTarget.FILE, OutputTarget.JSON} and self.directory and self.filename:
-            return self.directory / self.filename
+        if self.output_target in _FILE_TARGETS and self.directory and self.filename:
+            return Path(self.directory) / self.filename
         return None
@@ -1,5 +1,5 @@
 import threading
-from typing import Dict, Type, TypeVar
+from typing import Callable, Optional, TypeVar, Union
 
 from miraveja_log.application.configuration import LoggerConfig
 from miraveja_log.domain import ConfigurationException, IAsyncLogger, ILogger
@@ -13,8 +13,8 @@ class LoggerFactory:
 
     def __init__(
         self,
-        logger_implementation: Type[T],
-        async_logger_implementation: Type[AT],
+        logger_implementation: type[T],
+        async_logger_implementation: type[AT],
     ) -> None:
         """
         Initializes the LoggerFactory.
@@ -25,9 +25,13 @@ class LoggerFactory:
         """
         self._logger_implementation = logger_implementation
         self._async_logger_implementation = async_logger_implementation
-        self._sync_logger_cache: Dict[str, ILogger] = {}
-        self._async_logger_cache: Dict[str, IAsyncLogger] = {}
+        self._sync_logger_cache: dict[str, ILogger] = {}
+        self._async_logger_cache: dict[str, IAsyncLogger] = {}
         self._lock: threading.Lock = threading.Lock()
+        # Pre-bound C-level lookups for the lock-free fast path; clear_cache() must clear these dicts
+        # in place (never rebind them) so the bound methods keep pointing at the live caches.
+        self._get_cached_logger: Callable[[str], Optional[ILogger]] = self._sync_logger_cache.get
+        self._get_cached_async_logger: Callable[[str], Optional[IAsyncLogger]] = self._async_logger_cache.get
 
     def get_or_create_logger(self, config: LoggerConfig) -> ILogger:
         """
@@ -42,9 +46,15 @@ class LoggerFactory:
         Raises:
             ConfigurationException: If there is an error in the configuration or creation.
         """
+        # Lock-free fast path: dict lookups are atomic, so cache hits never contend on the lock
+        cached_logger: Optional[ILogger] = self._get_cached_logger(config.name)
+        if cached_logger is not None:
+            return cached_logger
+
         with self._lock:
-            if config.name in self._sync_logger_cache:
-                return self._sync_logger_cache[config.name]
+            cached_logger = self._sync_logger_cache.get(config.name)
+            if cached_logger is not None:
+                return cached_logger
 
             try:
                 logger = self._logger_implementation(config)
@@ -66,9 +76,15 @@ class LoggerFactory:
         Raises:
             ConfigurationException: If there is an error in the configuration or creation.
         """
+        # Lock-free fast path: dict lookups are atomic, so cache hits never contend on the lock
+        cached_async_logger: Optional[IAsyncLogger] = self._get_cached_async_logger(config.name)
+        if cached_async_logger is not None:
+            return cached_async_logger
+
         with self._lock:
-            if config.name in self._async_logger_cache:
-                return self._async_logger_cache[config.name]
+            cached_async_logger = self._async_logger_cache.get(config.name)
+            if cached_async_logger is not None:
+                return cached_async_logger
 
             try:
                 async_logger = self._async_logger_implementation(config)
@@ -78,7 +94,15 @@ class LoggerFactory:
                 raise ConfigurationException(f"Failed to create async logger '{config.name}'", str(e)) from e
 
     def clear_cache(self) -> None:
-        """Clear all logger caches. Useful for testing or reconfiguration."""
+        """Close and clear all cached loggers. Useful for testing or reconfiguration."""
         with self._lock:
+            cached_loggers: list[Union[ILogger, IAsyncLogger]] = [
+                *self._sync_logger_cache.values(),
+                *self._async_logger_cache.values(),
+            ]
             self._sync_logger_cache.clear()
             self._async_logger_cache.clear()
+
+        # Closing may join a listener thread, so it happens outside the lock
+        for logger in cached_loggers:
+            logger.close()
@@ -5,13 +5,20 @@ This layer contains the fundamental business rules and models for logging.
 It has no dependencies on other layers.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .enums import LogLevel, OutputTarget
 from .exceptions import ConfigurationException, HandlerException, LogException
 from .interfaces import IAsyncLogger, ILogger
-from .models import LogEntry
 
-# Rebuild Pydantic models to resolve forward references
-LogEntry.model_rebuild()
+if TYPE_CHECKING:
+    from .models import LogEntry
+
+# Exports whose modules pull in heavy dependencies (pydantic) and are loaded on first access
+_LAZY_EXPORTS: dict[str, str] = {
+    "LogEntry": ".models",
+}
 
 __all__: list[str] = [
     # Enums
@@ -27,3 +34,17 @@ __all__: list[str] = [
     "ConfigurationException",
     "HandlerException",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported symbols on first access (PEP 562)."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily exported symbols."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -1,6 +1,8 @@
 class LogException(Exception):
     """Base exception for logging-related errors."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str) -> None:
         self.message: str = message
         super().__init__(message)
@@ -9,6 +11,8 @@ class LogException(Exception):
 class ConfigurationException(LogException):
     """Exception raised for configuration-related errors in logging."""
 
+    __slots__ = ("field", "reason")
+
     def __init__(self, field: str, reason: str) -> None:
         self.field: str = field
         self.reason: str = reason
@@ -19,6 +23,8 @@ class ConfigurationException(LogException):
 class HandlerException(LogException):
     """Exception raised for errors related to log handlers."""
 
+    __slots__ = ("handler_type", "reason")
+
     def __init__(self, handler_type: str, reason: str) -> None:
         self.handler_type: str = handler_type
         self.reason: str = reason
@@ -5,6 +5,9 @@ from typing import Any
 class ILogger(ABC):
     """Abstract interface for synchronous logging operations."""
 
+    # Empty slots keep the interface from forcing a __dict__ onto implementations that declare their own
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, config: Any) -> None:
         """Initializes the logger."""
@@ -29,10 +32,16 @@ class ILogger(ABC):
     def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Logs a critical message."""
 
+    def close(self) -> None:
+        """Releases resources held by the logger. The default implementation holds none."""
+
 
 class IAsyncLogger(ABC):
     """Abstract interface for asynchronous logging operations."""
 
+    # Empty slots keep the interface from forcing a __dict__ onto implementations that declare their own
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, config: Any) -> None:
         """Initializes the asynchronous logger."""
@@ -56,3 +65,6 @@ class IAsyncLogger(ABC):
     @abstractmethod
     async def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Asynchronously logs a critical message."""
+
+    def close(self) -> None:
+        """Releases resources held by the logger. The default implementation holds none."""
@@ -7,6 +7,7 @@ Depends on Application and Domain layers.
 
 from .adapters import AsyncPythonLoggerAdapter, PythonLoggerAdapter
 from .formatters import JSONFormatter, TextFormatter
+from .handlers import BatchingQueueListener, BufferedFileHandler, LocalQueueHandler
 
 __all__: list[str] = [
     # Adapters
@@ -15,4 +16,8 @@ __all__: list[str] = [
     # Formatters
     "TextFormatter",
     "JSONFormatter",
+    # Handlers
+    "BatchingQueueListener",
+    "BufferedFileHandler",
+    "LocalQueueHandler",
 ]
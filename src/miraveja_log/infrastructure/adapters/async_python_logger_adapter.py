@@ -1,54 +1,58 @@
-import asyncio
-import sys
-from typing import Any
+import dataclasses
+import logging
+from typing import Any, Optional
 
 from miraveja_log.application import LoggerConfig
 from miraveja_log.domain import IAsyncLogger
 from miraveja_log.infrastructure.adapters.python_logger_adapter import PythonLoggerAdapter
+from miraveja_log.infrastructure.handlers.batching_queue_listener import BatchingQueueListener
 
 
 class AsyncPythonLoggerAdapter(IAsyncLogger):
     """Adapter wrapping Python's logging.Logger for asynchronous operations."""
 
+    __slots__ = ("_sync_adapter", "_logger", "_listener")
+
     def __init__(self, config: LoggerConfig) -> None:
         """
         Initialize adapter with configuration.
 
+        The underlying synchronous adapter is always queued, so logging calls only enqueue records
+        and the actual I/O happens on a background thread.
+
         Args:
             config: Logger configuration settings.
         """
 
-        self._sync_adapter = PythonLoggerAdapter(config)
+        self._sync_adapter = PythonLoggerAdapter(dataclasses.replace(config, use_queue=True))
+        self._logger: logging.Logger = self._sync_adapter._logger
+        self._listener: Optional[BatchingQueueListener] = self._sync_adapter._listener
 
-    def _capture_exc_info(self, kwargs: dict) -> dict:
-        """Capture exc_info before passing to thread to preserve exception context."""
-        if kwargs.get("exc_info") is True:
-            # Capture the actual exception info in the current context
-            kwargs = kwargs.copy()
-            kwargs["exc_info"] = sys.exc_info()
-        return kwargs
+    def close(self) -> None:
+        """Stop the queue listener, flushing any pending records to the real handlers."""
+        self._sync_adapter.close()
 
     async def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log a debug message."""
-        kwargs = self._capture_exc_info(kwargs)
-        await asyncio.to_thread(self._sync_adapter.debug, message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._sync_adapter.debug(message, *args, **kwargs)
 
     async def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log an info message."""
-        kwargs = self._capture_exc_info(kwargs)
-        await asyncio.to_thread(self._sync_adapter.info, message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._sync_adapter.info(message, *args, **kwargs)
 
     async def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log a warning message."""
-        kwargs = self._capture_exc_info(kwargs)
-        await asyncio.to_thread(self._sync_adapter.warning, message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._sync_adapter.warning(message, *args, **kwargs)
 
     async def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log an error message."""
-        kwargs = self._capture_exc_info(kwargs)
-        await asyncio.to_thread(self._sync_adapter.error, message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._sync_adapter.error(message, *args, **kwargs)
 
     async def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log a critical message."""
-        kwargs = self._capture_exc_info(kwargs)
-        await asyncio.to_thread(self._sync_adapter.critical, message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._sync_adapter.critical(message, *args, **kwargs)
@@ -1,24 +1,132 @@
+import atexit
+import functools
 import logging
-from typing import Any, Callable, Dict, Optional
+import os
+import queue
+import threading
+import weakref
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple, Union
 
 from miraveja_log.application import LoggerConfig
-from miraveja_log.domain import ConfigurationException, ILogger, OutputTarget
+from miraveja_log.domain import ConfigurationException, ILogger, LogLevel, OutputTarget
 from miraveja_log.infrastructure.formatters.json_formatter import JSONFormatter
 from miraveja_log.infrastructure.formatters.text_formatter import TextFormatter
+from miraveja_log.infrastructure.handlers.batching_queue_listener import BatchingQueueListener
+from miraveja_log.infrastructure.handlers.buffered_file_handler import BufferedFileHandler
+from miraveja_log.infrastructure.handlers.queue_handler import LocalQueueHandler
+
+# Running queue listeners by logger name. A running listener is kept alive by its own thread, so the weak
+# registry drops a listener once it is stopped and never keeps one alive on its own
+_queue_listeners: "weakref.WeakValueDictionary[str, BatchingQueueListener]" = weakref.WeakValueDictionary()
+_queue_listeners_lock: threading.Lock = threading.Lock()
+
+
+def _stop_queue_listeners() -> None:
+    """Stop every running queue listener, draining pending records at interpreter exit."""
+    with _queue_listeners_lock:
+        listeners: list[BatchingQueueListener] = list(_queue_listeners.values())
+        _queue_listeners.clear()
+    for listener in listeners:
+        PythonLoggerAdapter._stop_listener(listener)  # pylint: disable=protected-access
+
+
+atexit.register(_stop_queue_listeners)
 
 
 class PythonLoggerAdapter(ILogger):
     """Adapter wrapping Python's logging.Logger for synchronous operations."""
 
+    # File handlers shared by every logger writing to the same file with the same settings
+    _shared_file_handlers: Dict[Tuple[Any, ...], BufferedFileHandler] = {}
+    # Reentrant: adapter construction holds it while creating, attaching and releasing handlers
+    _shared_file_handlers_lock: threading.RLock = threading.RLock()
+
+    @staticmethod
+    def _is_reusable(handler: BufferedFileHandler) -> bool:
+        """Check that a shared handler is open and still points at the file on disk."""
+        if handler.closed:
+            return False
+        if handler.stream is None:
+            return True  # Not opened yet; it will open whatever is at the path on first write
+        try:
+            disk_stat = os.stat(handler.baseFilename)
+        except OSError:
+            return False
+        open_stat = os.fstat(handler.stream.fileno())
+        return (disk_stat.st_dev, disk_stat.st_ino) == (open_stat.st_dev, open_stat.st_ino)
+
     @staticmethod
     def _create_file_handler(config: LoggerConfig, default_name: str) -> logging.FileHandler:
-        """Create a FileHandler and ensure directory exists."""
+        """Get or create a shared buffered FileHandler, creating its directory on first use."""
         file_path = config.get_full_path()
-        if file_path:
-            # Create directory if it doesn't exist
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            return logging.FileHandler(str(file_path))
-        return logging.FileHandler(default_name)
+        filename: str = os.path.abspath(file_path if file_path else default_name)
+        key: Tuple[Any, ...] = (
+            config.output_target,
+            filename,
+            config.log_format,
+            config.date_format,
+            config.buffer_capacity,
+            config.flush_interval_ms,
+            config.flush_on_sigterm,
+        )
+
+        with PythonLoggerAdapter._shared_file_handlers_lock:
+            handler: Optional[BufferedFileHandler] = PythonLoggerAdapter._shared_file_handlers.get(key)
+            if handler is None or not PythonLoggerAdapter._is_reusable(handler):
+                # Create directory if it doesn't exist
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                handler = BufferedFileHandler(
+                    filename,
+                    buffer_capacity=config.buffer_capacity,
+                    flush_interval=config.flush_interval_ms / 1000,
+                    flush_on_sigterm=config.flush_on_sigterm,
+                )
+                PythonLoggerAdapter._shared_file_handlers[key] = handler
+            return handler
+
+    @staticmethod
+    def _handlers_in_use() -> Set[logging.Handler]:
+        """Collect the handlers attached to any logger or to the listener of a live queued adapter."""
+        loggers: list[Any] = [logging.root, *logging.Logger.manager.loggerDict.values()]
+        in_use: Set[logging.Handler] = {
+            handler for logger in loggers if isinstance(logger, logging.Logger) for handler in logger.handlers
+        }
+        with _queue_listeners_lock:
+            for listener in _queue_listeners.values():
+                in_use.update(listener.handlers)
+        return in_use
+
+    @staticmethod
+    def _release_file_handlers(handlers: Iterable[logging.Handler]) -> None:
+        """Close and forget those of the given shared file handlers that nothing writes to anymore."""
+        released: Set[logging.Handler] = set(handlers)
+        if not released:
+            return
+        with PythonLoggerAdapter._shared_file_handlers_lock:
+            in_use: Set[logging.Handler] = PythonLoggerAdapter._handlers_in_use()
+            for key, handler in list(PythonLoggerAdapter._shared_file_handlers.items()):
+                if handler in released and handler not in in_use:
+                    del PythonLoggerAdapter._shared_file_handlers[key]
+                    handler.close()
+
+    @staticmethod
+    def release_file_handlers(directory: Optional[Union[str, "os.PathLike[str]"]] = None) -> None:
+        """
+        Close and forget the shared file handlers, whether or not a logger still uses them.
+
+        A logger that keeps writing after its handler is released reopens the file on the next record,
+        so this is meant for tests and shutdown code that remove the log files afterwards.
+
+        Args:
+            directory: Only release handlers writing to files under this directory; all of them when omitted.
+        """
+        root: Optional[str] = os.path.realpath(directory) if directory is not None else None
+        with PythonLoggerAdapter._shared_file_handlers_lock:
+            for key, handler in list(PythonLoggerAdapter._shared_file_handlers.items()):
+                filename: str = os.path.realpath(handler.baseFilename)
+                if root is None or os.path.commonpath([root, filename]) == root:
+                    del PythonLoggerAdapter._shared_file_handlers[key]
+                    handler.close()
 
     HANDLER_TARGET_MAPPER: Dict[OutputTarget, Callable[[LoggerConfig], logging.Handler]] = {
         OutputTarget.CONSOLE: lambda config: logging.StreamHandler(),
@@ -26,10 +134,36 @@ class PythonLoggerAdapter(ILogger):
         OutputTarget.JSON: lambda config: PythonLoggerAdapter._create_file_handler(config, "app.json"),
     }
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _create_text_formatter(log_format: Optional[str], date_format: Optional[str], name: str) -> TextFormatter:
+        """Get or create the text formatter for a format, date format and logger name."""
+        return TextFormatter(log_format, date_format, name)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _create_json_formatter(log_format: Optional[str], date_format: Optional[str]) -> JSONFormatter:
+        """Get or create the JSON formatter for a format and date format, shared across logger names."""
+        return JSONFormatter(log_format, date_format)
+
     FORMATTER_TARGET_MAPPER: Dict[OutputTarget, Callable[[LoggerConfig], logging.Formatter]] = {
-        OutputTarget.CONSOLE: lambda config: TextFormatter(config.log_format, config.date_format),
-        OutputTarget.FILE: lambda config: TextFormatter(config.log_format, config.date_format),
-        OutputTarget.JSON: lambda config: JSONFormatter(config.log_format, config.date_format),
+        OutputTarget.CONSOLE: lambda config: PythonLoggerAdapter._create_text_formatter(
+            config.log_format, config.date_format, config.name
+        ),
+        OutputTarget.FILE: lambda config: PythonLoggerAdapter._create_text_formatter(
+            config.log_format, config.date_format, config.name
+        ),
+        OutputTarget.JSON: lambda config: PythonLoggerAdapter._create_json_formatter(
+            config.log_format, config.date_format
+        ),
+    }
+
+    LEVEL_MAPPER: Dict[LogLevel, int] = {
+        LogLevel.DEBUG: logging.DEBUG,
+        LogLevel.INFO: logging.INFO,
+        LogLevel.WARNING: logging.WARNING,
+        LogLevel.ERROR: logging.ERROR,
+        LogLevel.CRITICAL: logging.CRITICAL,
     }
 
     def __init__(self, config: LoggerConfig) -> None:
@@ -41,63 +175,118 @@ class PythonLoggerAdapter(ILogger):
         """
 
         self._config: LoggerConfig = config
-        self._logger: logging.Logger = self._configure_logger()
+        self._listener: Optional[BatchingQueueListener] = None
+        self._queue_handler: Optional[LocalQueueHandler] = None
+        self._closed: bool = False
+        # Held throughout so a concurrent release never closes a shared handler between lookup and attach
+        with PythonLoggerAdapter._shared_file_handlers_lock:
+            detached_handlers: list[logging.Handler] = list(logging.getLogger(config.name).handlers)
+            self._logger: logging.Logger = self._configure_logger()
+            if config.use_queue:
+                self._start_queue_listener()
+
+            # The rebuilt logger no longer routes records to the previous listener's queue, so stop it
+            with _queue_listeners_lock:
+                previous: Optional[BatchingQueueListener] = _queue_listeners.pop(config.name, None)
+                if self._listener is not None:
+                    _queue_listeners[config.name] = self._listener
+            if previous is not None:
+                self._stop_listener(previous)
+            self._release_file_handlers(detached_handlers)
 
-    def _select_handler_based_on_target(self) -> logging.Handler:
-        """Select the appropriate logging handler based on the output target."""
+    def _configure_logger(self) -> logging.Logger:
+        """Configure the underlying Python logger based on the provided configuration."""
+        # Resolve both factories first so an unsupported target neither opens a file nor
+        # strips the handlers of an existing logger with the same name
+        output_target: OutputTarget = self._config.output_target
         handler_factory: Optional[Callable[[LoggerConfig], logging.Handler]] = self.HANDLER_TARGET_MAPPER.get(
-            self._config.output_target
+            output_target
         )
-        if not handler_factory:
-            raise ConfigurationException(
-                field="output_target",
-                reason=f"Unsupported output target: {self._config.output_target}",
-            )
-        return handler_factory(self._config)
-
-    def _select_formatter_based_on_target(self) -> logging.Formatter:
-        """Select the appropriate logging formatter based on the output target."""
         formatter_factory: Optional[Callable[[LoggerConfig], logging.Formatter]] = self.FORMATTER_TARGET_MAPPER.get(
-            self._config.output_target
+            output_target
         )
-        if not formatter_factory:
-            raise ConfigurationException(
-                field="output_target",
-                reason=f"Unsupported output target: {self._config.output_target}",
-            )
-        return formatter_factory(self._config)
+        if handler_factory is None or formatter_factory is None:
+            raise ConfigurationException(field="output_target", reason=f"Unsupported output target: {output_target}")
 
-    def _configure_logger(self) -> logging.Logger:
-        """Configure the underlying Python logger based on the provided configuration."""
         logger: logging.Logger = logging.getLogger(self._config.name)
-        logger.setLevel(self._config.level.value)
-        logger.handlers.clear()  # Clear existing handlers
+        level: int = self.LEVEL_MAPPER[self._config.level]
+        # setLevel invalidates the isEnabledFor cache of every logger, so skip it when nothing changes
+        if logger.level != level:
+            logger.setLevel(level)
         logger.propagate = False  # Prevent propagation to root logger
 
-        handler: logging.Handler = self._select_handler_based_on_target()
-        formatter: logging.Formatter = self._select_formatter_based_on_target()
+        handler: logging.Handler = handler_factory(self._config)
+        # Shared file handlers keep the formatter of the logger that created them
+        if handler.formatter is None:
+            handler.setFormatter(formatter_factory(self._config))
 
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        # Rebuilding a logger with the same file settings yields the same shared handler; leave it attached
+        if logger.handlers != [handler]:
+            logger.handlers.clear()  # Clear existing handlers
+            logger.addHandler(handler)
 
         return logger
 
+    def _start_queue_listener(self) -> None:
+        """Move the logger's handlers behind a QueueListener so logging calls only enqueue records."""
+        handlers: list[logging.Handler] = list(self._logger.handlers)
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._listener = BatchingQueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+
+        self._queue_handler = LocalQueueHandler(log_queue)
+        self._logger.handlers.clear()
+        self._logger.addHandler(self._queue_handler)
+
+    @staticmethod
+    def _stop_listener(listener: BatchingQueueListener) -> None:
+        """Stop a queue listener, then close the shared file handlers that only it wrote to."""
+        listener.stop()
+        PythonLoggerAdapter._release_file_handlers(listener.handlers)
+
+    def close(self) -> None:
+        """
+        Stop the queue listener, if any, flushing pending records to the real handlers.
+
+        The logger writes to those handlers directly afterwards, so an adapter that is still held keeps
+        logging. Shared file handlers that no logger uses anymore are closed as well.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._listener is not None:
+            with _queue_listeners_lock:
+                if _queue_listeners.get(self._config.name) is self._listener:
+                    del _queue_listeners[self._config.name]
+            with PythonLoggerAdapter._shared_file_handlers_lock:
+                # Swap back to direct delivery before draining so no record is left in a queue nobody reads
+                if self._queue_handler in self._logger.handlers:
+                    self._logger.removeHandler(self._queue_handler)
+                    for handler in self._listener.handlers:
+                        self._logger.addHandler(handler)
+                self._stop_listener(self._listener)
+
     def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log a debug message."""
-        self._logger.debug(message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(message, *args, **kwargs)
 
     def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log an info message."""
-        self._logger.info(message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(message, *args, **kwargs)
 
     def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log a warning message."""
-        self._logger.warning(message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(message, *args, **kwargs)
 
     def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log an error message."""
-        self._logger.error(message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(message, *args, **kwargs)
 
     def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log a critical message."""
-        self._logger.critical(message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._logger.critical(message, *args, **kwargs)
@@ -1,33 +1,38 @@
 import json
 import logging
-from datetime import datetime
-from typing import Dict
+import re
+import time
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
 
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured log output."""
 
-    def format(self, record: logging.LogRecord) -> str:
-        """
-        Format log record as JSON.
+    TIMESTAMP_FORMAT: str = "%Y-%m-%dT%H:%M:%S"
 
-        Args:
-            record: Log record to format
+    EXTRA_KEYS_CACHE_SIZE: int = 256
 
-        Returns:
-            JSON-formatted log string
-        """
+    # Item and key separators of the canonical output; orjson has no option for any other layout
+    SEPARATORS: Tuple[str, str] = (",", ":")
 
-        log_data: Dict[str, str] = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
-            "level": record.levelname,
-            "name": record.name,
-            "message": record.getMessage(),
-        }
+    # Literal key fragments for records without extras or exception, laid out like serialize() output
+    FIXED_FIELDS: Tuple[str, ...] = ('{"timestamp":"', '","level":', ',"name":', ',"message":', "}")
 
-        # Extract extra fields from LogRecord attributes
-        # Python logging adds extra fields as attributes on the record
-        reserved_attrs = {
+    FIXED_FIELDS_CACHE_SIZE: int = 256
+
+    # Runs of DEL and non-ASCII characters, which orjson writes unescaped and only ever inside JSON strings
+    NON_ASCII_PATTERN: "re.Pattern[str]" = re.compile(r"[^\x00-\x7e]+")
+
+    # Standard LogRecord attributes, plus those logging.Formatter adds, that are never emitted as extra fields
+    RESERVED_ATTRS: FrozenSet[str] = frozenset(
+        {
+            "asctime",
             "name",
             "msg",
             "args",
@@ -52,13 +57,205 @@ class JSONFormatter(logging.Formatter):
             "getMessage",
             "taskName",
         }
+    )
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None) -> None:
+        """
+        Initialize the JSON formatter.
+
+        Args:
+            fmt: The log message format.
+            datefmt: The date format for log messages.
+        """
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        # (second, formatted prefix) kept in one tuple so concurrent readers never see a torn pair
+        self._second_cache: Tuple[int, str] = (-1, "")
+        # Extra field names per record attribute layout; log sites reuse the same extras
+        self._extra_keys_cache: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        # Escaped level and logger name sections per (level, name)
+        self._fixed_fields_cache: Dict[Tuple[str, str], Tuple[str, str]] = {}
 
-        for key, value in record.__dict__.items():
-            if key not in reserved_attrs and not key.startswith("_"):
-                log_data[key] = value
+    def format_timestamp(self, created: float) -> str:
+        """
+        Format a record creation time as a local ISO 8601 string.
+
+        The output matches ``datetime.fromtimestamp(created).isoformat()``, but the date and time
+        portion is rendered once per second and reused for every record created within it.
+
+        Args:
+            created: POSIX timestamp of the record (``LogRecord.created``).
+
+        Returns:
+            ISO 8601 formatted timestamp.
+        """
+        second = int(created)
+        # Same rounding as datetime.fromtimestamp: half-even on microseconds, carrying into the second
+        microsecond = round((created - second) * 1e6)
+        if microsecond >= 1_000_000:
+            second += 1
+            microsecond -= 1_000_000
+
+        cached_second, prefix = self._second_cache
+        if cached_second != second:
+            prefix = time.strftime(self.TIMESTAMP_FORMAT, time.localtime(second))
+            self._second_cache = (second, prefix)
+
+        if microsecond:
+            return f"{prefix}.{microsecond:06d}"
+        return prefix
+
+    def _extra_keys(self, attribute_names: Tuple[str, ...]) -> Tuple[str, ...]:
+        """
+        Return the extra field names for a record with the given attributes.
 
-        # Handle exception information
+        Records from the same log site share an attribute layout, so the reserved-name filtering
+        is done once per layout and looked up afterwards. The cache stops growing at
+        ``EXTRA_KEYS_CACHE_SIZE`` layouts so call sites with ever-changing extras cannot exhaust memory.
+
+        Args:
+            attribute_names: Attribute names of the record, in insertion order.
+
+        Returns:
+            The attribute names to emit as extra fields.
+        """
+        extra_keys: Optional[Tuple[str, ...]] = self._extra_keys_cache.get(attribute_names)
+        if extra_keys is None:
+            reserved_attrs: FrozenSet[str] = self.RESERVED_ATTRS
+            extra_keys = tuple(key for key in attribute_names if key not in reserved_attrs and not key.startswith("_"))
+            if len(self._extra_keys_cache) < self.EXTRA_KEYS_CACHE_SIZE:
+                self._extra_keys_cache[attribute_names] = extra_keys
+        return extra_keys
+
+    @staticmethod
+    def _get_message(record: logging.LogRecord) -> str:
+        """
+        Return the record's message, skipping ``getMessage()`` when there is nothing to merge.
+
+        Records without arguments whose message is already a string (including every record
+        prepared by ``LocalQueueHandler``) need no ``%`` interpolation or ``str()`` call.
+
+        Args:
+            record: Log record to read the message from.
+
+        Returns:
+            The merged log message.
+        """
+        msg = record.msg
+        if not record.args and type(msg) is str:  # pylint: disable=unidiomatic-typecheck
+            return msg
+        return record.getMessage()
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format log record as JSON.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            JSON-formatted log string
+        """
+
+        timestamp: str = self.format_timestamp(record.created)
+        message: str = self._get_message(record)
+
+        # Extract extra fields from LogRecord attributes
+        # Python logging adds extra fields as attributes on the record
+        record_dict: Dict[str, Any] = record.__dict__
+        extra_keys: Tuple[str, ...] = self._extra_keys(tuple(record_dict))
+
+        if not extra_keys and not record.exc_info:
+            try:
+                return self._serialize_fixed_fields(timestamp, record.levelname, record.name, message)
+            except TypeError:
+                pass  # Non-string level or logger name; let the encoder decide
+
+        log_data: Dict[str, Any] = {
+            "timestamp": timestamp,
+            "level": record.levelname,
+            "name": record.name,
+            "message": message,
+        }
+        for key in extra_keys:
+            log_data[key] = record_dict[key]
+
+        # Handle exception information, caching the traceback text like logging.Formatter does
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data["exception"] = record.exc_text
+
+        return self.serialize(log_data)
+
+    def _serialize_fixed_fields(self, timestamp: str, level: str, name: str, message: str) -> str:
+        """
+        Serialize the four fields every record carries without building a dictionary.
+
+        The key set is fixed, so the output is joined from precomputed key fragments and the
+        escaped values, byte for byte what ``serialize`` produces for the same fields. A formatter
+        sees few level and logger name pairs, so the section between timestamp and message is
+        escaped once per pair.
+
+        Args:
+            timestamp: ISO 8601 timestamp, which never needs escaping.
+            level: Level name of the record.
+            name: Logger name of the record.
+            message: Merged log message.
+
+        Returns:
+            JSON-encoded log data.
+        """
+        key: Tuple[str, str] = (level, name)
+        fields: Optional[Tuple[str, str]] = self._fixed_fields_cache.get(key)
+        if fields is None:
+            fragments: Tuple[str, ...] = self.FIXED_FIELDS
+            fields = (
+                fragments[0],
+                "".join(
+                    (
+                        fragments[1],
+                        encode_basestring_ascii(level),
+                        fragments[2],
+                        encode_basestring_ascii(name),
+                        fragments[3],
+                    )
+                ),
+            )
+            if len(self._fixed_fields_cache) < self.FIXED_FIELDS_CACHE_SIZE:
+                self._fixed_fields_cache[key] = fields
+        return "".join((fields[0], timestamp, fields[1], encode_basestring_ascii(message), "}"))
+
+    @staticmethod
+    def serialize(log_data: Dict[str, Any]) -> str:
+        """
+        Serialize log data to a JSON string.
+
+        Uses orjson when it is installed and falls back to the standard library encoder, which is
+        also used for values orjson rejects (e.g. integers wider than 64 bits). Both write the same
+        layout: compact separators, with non-ASCII characters escaped as ``_serialize_fixed_fields``
+        does, so a log file never mixes layouts or encodings.
 
-        return json.dumps(log_data)
+        Values outside plain JSON types are not normalized: orjson also accepts datetimes, UUIDs and
+        dataclasses, writes NaN and infinities as null, and spells some floats differently (``1e16``
+        rather than ``1e+16``), so such values do depend on whether orjson is installed.
+
+        Args:
+            log_data: The log data to serialize.
+
+        Returns:
+            JSON-encoded log data.
+        """
+        if orjson is not None:
+            try:
+                encoded: bytes = orjson.dumps(log_data, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass
+            else:
+                text: str = encoded.decode()
+                if JSONFormatter.NON_ASCII_PATTERN.search(text) is None:
+                    return text
+                # Escape them like the json module's ensure_ascii does
+                return JSONFormatter.NON_ASCII_PATTERN.sub(
+                    lambda match: encode_basestring_ascii(match.group())[1:-1], text
+                )
+        return json.dumps(log_data, separators=JSONFormatter.SEPARATORS)
@@ -1,16 +1,143 @@
 import logging
-from typing import Optional
+import operator
+import re
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+# Positional format plus a getter returning the record attributes it consumes, in order
+CompiledFormat = Tuple[str, Callable[[logging.LogRecord], Tuple[Any, ...]]]
 
 
 class TextFormatter(logging.Formatter):
     """Standard text formatter for console and file output."""
 
-    def __init__(self, log_format: Optional[str] = None, date_format: Optional[str] = None) -> None:
+    NAME_PLACEHOLDER: str = "%(name)s"
+
+    # A literal '%%', a named '%(field)' conversion, or any other '%' (which disables compilation)
+    CONVERSION_PATTERN: "re.Pattern[str]" = re.compile(r"%%|%\((\w+)\)|%")
+
+    def __init__(
+        self,
+        log_format: Optional[str] = None,
+        date_format: Optional[str] = None,
+        logger_name: Optional[str] = None,
+    ) -> None:
         """
         Initialize the text formatter.
 
         Args:
             log_format: The log message format.
             date_format: The date format for log messages.
+            logger_name: Name of the logger this formatter serves. When given, ``%(name)s`` is baked
+                into a specialized format string used for that logger's own records.
         """
         super().__init__(fmt=log_format, datefmt=date_format)
+        # The format string never changes, so whether it renders asctime is decided once, not per record
+        self._uses_time: bool = self._style.usesTime()
+        # (second, date format, rendered time) kept in one tuple so concurrent readers never see a torn entry
+        self._time_cache: Tuple[int, Optional[str], str] = (-1, None, "")
+        self._logger_name: Optional[str] = None
+        self._specialized_style: Optional[logging.PercentStyle] = None
+        if logger_name is not None and self.NAME_PLACEHOLDER in self._fmt:
+            self._logger_name = logger_name
+            # Escape '%' so the literal name is not treated as a conversion specifier
+            baked_format = self._fmt.replace(self.NAME_PLACEHOLDER, logger_name.replace("%", "%%"))
+            self._specialized_style = logging.PercentStyle(baked_format)
+        self._compiled_format: Optional[CompiledFormat] = self._compile_format(self._fmt)
+        self._compiled_specialized_format: Optional[CompiledFormat] = (
+            self._compile_format(self._specialized_style._fmt) if self._specialized_style is not None else None
+        )
+
+    @classmethod
+    def _compile_format(cls, log_format: str) -> Optional[CompiledFormat]:
+        """
+        Rewrite a ``%(field)``-style format into a positional format and an attribute getter.
+
+        Applying a positional format to a tuple fetched by ``operator.attrgetter`` skips the Python-level
+        ``PercentStyle.format()`` frames, and both steps run in C.
+
+        Args:
+            log_format: The ``%``-style format string.
+
+        Returns:
+            The compiled format, or None when the format has no named fields, uses ``*`` widths, or
+            mixes in unnamed conversions; such formats keep going through ``PercentStyle``.
+        """
+        if "*" in log_format:
+            return None
+
+        field_names: List[Optional[str]] = []
+
+        def to_positional(match: "re.Match[str]") -> str:
+            if match.group(0) == "%%":
+                return "%%"
+            field_names.append(match.group(1))
+            return "%"
+
+        positional_format = cls.CONVERSION_PATTERN.sub(to_positional, log_format)
+        if not field_names or None in field_names:
+            return None
+
+        if len(field_names) == 1:
+            get_field = operator.attrgetter(field_names[0])
+            return positional_format, lambda record: (get_field(record),)
+        return positional_format, operator.attrgetter(*field_names)
+
+    def usesTime(self) -> bool:
+        """
+        Check whether the format renders the record creation time.
+
+        Returns:
+            True if the format references ``%(asctime)s``, so ``format()`` must call ``formatTime()``.
+        """
+        return self._uses_time
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """
+        Format the record's message line.
+
+        Records from the configured logger use the specialized format; records that propagate from
+        child loggers carry a different name and fall back to the generic format.
+
+        Args:
+            record: Log record to format.
+
+        Returns:
+            The formatted message line.
+        """
+        if self._specialized_style is not None and record.name == self._logger_name:
+            style, compiled_format = self._specialized_style, self._compiled_specialized_format
+        else:
+            style, compiled_format = self._style, self._compiled_format
+
+        if compiled_format is not None:
+            positional_format, get_fields = compiled_format
+            try:
+                return positional_format % get_fields(record)
+            except AttributeError:
+                pass  # A field is missing from the record; the style raises the error logging.Formatter would
+        return style.format(record)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """
+        Format the record creation time, rendering the date and time once per second.
+
+        ``time.strftime`` has no sub-second directives, so every record created within the same
+        second shares the rendered text; only the millisecond suffix of the default format varies.
+
+        Args:
+            record: Log record whose creation time is formatted.
+            datefmt: Date format to use; the default format with milliseconds is used when omitted.
+
+        Returns:
+            The formatted creation time.
+        """
+        second = int(record.created)
+        cached_second, cached_datefmt, text = self._time_cache
+        if cached_second != second or cached_datefmt != datefmt:
+            text = time.strftime(datefmt or self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, datefmt, text)
+
+        if not datefmt and self.default_msec_format:
+            return self.default_msec_format % (text, record.msecs)
+        return text
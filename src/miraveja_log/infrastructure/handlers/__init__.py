@@ -0,0 +1,11 @@
+"""Handlers for log delivery."""
+
+from .batching_queue_listener import BatchingQueueListener
+from .buffered_file_handler import BufferedFileHandler
+from .queue_handler import LocalQueueHandler
+
+__all__: list[str] = [
+    "BatchingQueueListener",
+    "BufferedFileHandler",
+    "LocalQueueHandler",
+]
@@ -0,0 +1,77 @@
+import logging
+import threading
+from logging.handlers import QueueListener
+from typing import Any
+
+
+class BatchingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers once per burst of queued records."""
+
+    def __init__(
+        self,
+        log_queue: Any,
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+        batch_size: int = 512,
+    ) -> None:
+        """
+        Initialize the listener.
+
+        Args:
+            log_queue: The queue records are read from; it must provide ``empty()``.
+            *handlers: The handlers that receive the records.
+            respect_handler_level: Whether to skip handlers whose level is above the record's level.
+            batch_size: Maximum number of records handled before the handlers are flushed during a burst.
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.batch_size: int = batch_size
+        # Records handled since the queue was last seen empty; only touched by the listener thread
+        self._unflushed: int = 0
+        self._running: bool = False
+        self._running_lock: threading.Lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the background thread that handles queued records."""
+        with self._running_lock:
+            super().start()
+            self._running = True
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """
+        Handle a record, flushing the handlers once a burst of queued records has been drained.
+
+        A record that arrives on its own is left to the handlers' own flush policy, so light load
+        adds no flushes; when several records were queued together, they share one flush.
+
+        Args:
+            record: The record to handle.
+        """
+        super().handle(record)
+        self._unflushed += 1
+        if self._unflushed >= self.batch_size or self.queue.empty():
+            if self._unflushed > 1:
+                self.flush_handlers()
+            self._unflushed = 0
+
+    def flush_handlers(self) -> None:
+        """Flush every handler, ignoring streams that were already closed."""
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                # Stream already closed (e.g. during interpreter shutdown), same as logging.shutdown
+                pass
+
+    def stop(self) -> None:
+        """
+        Stop the listener after it has handled every queued record, then flush the handlers.
+
+        Stopping a listener that is not running does nothing, so several owners may each stop it.
+        """
+        with self._running_lock:
+            if not self._running:
+                return
+            self._running = False
+        super().stop()
+        self._unflushed = 0
+        self.flush_handlers()
@@ -0,0 +1,167 @@
+import logging
+import os
+import signal
+import threading
+import weakref
+from types import FrameType
+from typing import IO, Any, Optional
+
+# Handlers that opted in to being flushed when the process receives SIGTERM
+_live_handlers: "weakref.WeakSet[BufferedFileHandler]" = weakref.WeakSet()
+_sigterm_flush_lock: threading.Lock = threading.Lock()
+_sigterm_flush_installed: threading.Event = threading.Event()
+
+# Longest the SIGTERM flush waits for a handler that another thread is writing through
+_SIGTERM_FLUSH_TIMEOUT: float = 1.0
+
+
+def _flush_on_sigterm(signum: int, frame: Optional[FrameType]) -> None:  # pylint: disable=unused-argument
+    """Flush every live handler, then terminate through the default SIGTERM action."""
+    for handler in list(_live_handlers):
+        # Never wait unboundedly in a signal handler; a handler still locked after the timeout is skipped
+        if not handler.lock.acquire(timeout=_SIGTERM_FLUSH_TIMEOUT):
+            continue
+        try:
+            handler.flush()
+        except (RuntimeError, OSError, ValueError):
+            # The signal may interrupt a write in progress on this very stream
+            pass
+        finally:
+            handler.lock.release()
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def _install_sigterm_flush() -> None:
+    """
+    Flush buffered handlers on SIGTERM, which otherwise kills the process without running atexit.
+
+    Only installed from the main thread and only when SIGTERM still has its default action, so an
+    application's own handler is never replaced.
+    """
+    with _sigterm_flush_lock:
+        if _sigterm_flush_installed.is_set() or threading.current_thread() is not threading.main_thread():
+            return
+        if not hasattr(signal, "SIGTERM") or signal.getsignal(signal.SIGTERM) is not signal.SIG_DFL:
+            return
+        signal.signal(signal.SIGTERM, _flush_on_sigterm)
+        _sigterm_flush_installed.set()
+
+
+def _flush_periodically(
+    handler_ref: "weakref.ref[BufferedFileHandler]", stop: threading.Event, interval: float
+) -> None:
+    """Flush the referenced handler every ``interval`` seconds until stopped or garbage collected."""
+    while not stop.wait(interval):
+        handler: Optional[BufferedFileHandler] = handler_ref()
+        if handler is None:
+            return
+        # Idle handlers are skipped so the flusher does not contend for the handler lock
+        if handler.has_pending_writes:
+            handler.flush()
+        del handler
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that coalesces writes in a large userspace buffer instead of flushing every record."""
+
+    def __init__(
+        self,
+        filename: str,
+        buffer_capacity: int = 65536,
+        flush_interval: float = 0.2,
+        flush_level: int = logging.ERROR,
+        mode: str = "a",
+        encoding: Optional[str] = None,
+        flush_on_sigterm: bool = False,
+        delay: bool = False,
+    ) -> None:
+        """
+        Initialize the buffered file handler.
+
+        Args:
+            filename: Path of the log file.
+            buffer_capacity: Size in bytes of the write buffer placed in front of the file. A capacity of 1
+                selects line buffering, writing every record through as it is emitted.
+            flush_interval: Seconds between background flushes, bounding how stale the file can be.
+            flush_level: Records at or above this level are flushed immediately.
+            mode: Mode used to open the file.
+            encoding: Encoding used to open the file.
+            flush_on_sigterm: Flush this handler if the process is terminated with SIGTERM. The first handler
+                that opts in installs a process-wide SIGTERM handler, so this is off by default.
+            delay: Defer opening, and thereby creating, the file until the first record is written.
+        """
+        self.buffer_capacity: int = buffer_capacity
+        self.flush_level: int = flush_level
+        self._pending_writes: bool = False
+        super().__init__(filename, mode=mode, encoding=encoding, delay=delay)
+
+        self._stop_flusher: threading.Event = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=_flush_periodically,
+                args=(weakref.ref(self), self._stop_flusher, flush_interval),
+                name=f"BufferedFileHandler-{self.baseFilename}",
+                daemon=True,
+            )
+            self._flusher.start()
+
+        if flush_on_sigterm:
+            _live_handlers.add(self)
+            _install_sigterm_flush()
+
+    def _open(self) -> IO[Any]:
+        """Open the log file with a write buffer of ``buffer_capacity`` bytes."""
+        return open(  # pylint: disable=consider-using-with
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_capacity,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write the formatted record to the buffer, flushing only for severe records.
+
+        Args:
+            record: The log record to write.
+        """
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+            else:
+                self._pending_writes = True
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Flush the buffered records to the file."""
+        self.acquire()
+        try:
+            self._pending_writes = False
+            super().flush()
+        finally:
+            self.release()
+
+    @property
+    def has_pending_writes(self) -> bool:
+        """Whether records were written to the buffer since the last flush."""
+        return self._pending_writes
+
+    @property
+    def closed(self) -> bool:
+        """Whether ``close()`` has been called on this handler."""
+        return self._stop_flusher.is_set()
+
+    def close(self) -> None:
+        """Stop the background flusher and close the file, writing out any buffered records."""
+        self._stop_flusher.set()
+        _live_handlers.discard(self)
+        super().close()
@@ -0,0 +1,26 @@
+import copy
+import logging
+from logging.handlers import QueueHandler
+
+
+class LocalQueueHandler(QueueHandler):
+    """QueueHandler for in-process queues that keeps records intact for downstream formatters."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for enqueuing.
+
+        The stock implementation pre-formats the record and drops ``exc_info`` so it can be pickled.
+        The queue never leaves the process, so only the message arguments are merged and the
+        exception info is kept for the real handler's formatter.
+
+        Args:
+            record: The log record to prepare.
+
+        Returns:
+            A shallow copy of the record with its message arguments applied.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
@@ -1,5 +1,7 @@
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from collections.abc import Mapping
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 
 from miraveja_log.domain import ILogger
 
@@ -7,12 +9,38 @@ from miraveja_log.domain import ILogger
 class MemoryHandler(logging.Handler):
     """Handler that captures log records in memory for testing."""
 
-    def __init__(self) -> None:
+    def __init__(self, capacity: Optional[int] = None) -> None:
         """
         Initialize the memory handler.
+
+        Args:
+            capacity: Maximum number of records kept; once reached, the oldest records are dropped.
+                Unbounded when None, in which case ``records`` is a plain list.
         """
         super().__init__()
-        self.records: List[logging.LogRecord] = []
+        # A deque only when bounded, so the default keeps list behaviour such as slicing and list equality
+        self.records: Union[List[logging.LogRecord], Deque[logging.LogRecord]] = (
+            [] if capacity is None else deque(maxlen=capacity)
+        )
+
+    def handle(self, record: logging.LogRecord) -> Union[bool, logging.LogRecord]:
+        """
+        Filter and store the log record without taking the handler lock.
+
+        ``list.append`` and ``deque.append`` are atomic, so concurrent emitters need no lock around ``emit()``.
+
+        Args:
+            record: The log record to handle.
+
+        Returns:
+            The filter result, as ``logging.Handler.handle`` returns it.
+        """
+        result = self.filter(record)
+        if isinstance(result, logging.LogRecord):  # Filters may return a replacement record (Python 3.12+)
+            record = result
+        if result:
+            self.emit(record)
+        return result
 
     def emit(self, record: logging.LogRecord) -> None:
         """
@@ -36,7 +64,9 @@ class MemoryHandler(logging.Handler):
         Returns:
             A list of log messages.
         """
-        return [self.format(record) for record in self.records]
+        # Resolve the formatter once instead of per record, as Handler.format() would
+        format_record = (self.formatter or logging.Formatter()).format
+        return [format_record(record) for record in self.records]
 
 
 class MockLogger(ILogger):
@@ -46,44 +76,90 @@ class MockLogger(ILogger):
         """
         Initialize the mock logger.
         """
-        self.calls: List[Tuple[str, str, Tuple, Dict]] = []  # (level, message, args, kwargs)
+        # Calls are stored column-wise so recording one is a few pointer appends, not a tuple per call
+        self._levels: List[str] = []
+        self._messages: List[str] = []
+        self._args: List[Tuple] = []
+        self._kwargs: List[Dict] = []
+
+    @property
+    def calls(self) -> List[Tuple[str, str, Tuple, Dict]]:
+        """
+        Recorded log calls as (level, message, args, kwargs) tuples.
+
+        Returns:
+            A new list with one tuple per recorded call, in call order.
+        """
+        return list(zip(self._levels, self._messages, self._args, self._kwargs))
+
+    def _record(self, level: str, message: str, args: Tuple, kwargs: Dict) -> None:
+        """Record a single log call."""
+        self._levels.append(level)
+        self._messages.append(message)
+        self._args.append(args)
+        self._kwargs.append(kwargs)
 
     def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log a debug message."""
-        self.calls.append(("debug", message, args, kwargs))
+        self._record("debug", message, args, kwargs)
 
     def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log an info message."""
-        self.calls.append(("info", message, args, kwargs))
+        self._record("info", message, args, kwargs)
 
     def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log a warning message."""
-        self.calls.append(("warning", message, args, kwargs))
+        self._record("warning", message, args, kwargs)
 
     def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log an error message."""
-        self.calls.append(("error", message, args, kwargs))
+        self._record("error", message, args, kwargs)
 
     def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log a critical message."""
-        self.calls.append(("critical", message, args, kwargs))
+        self._record("critical", message, args, kwargs)
 
     def clear(self) -> None:
         """
         Clear all recorded log calls.
         """
-        self.calls.clear()
+        self._levels.clear()
+        self._messages.clear()
+        self._args.clear()
+        self._kwargs.clear()
 
     def get_messages(self, level: Optional[str] = None) -> List[str]:
         """
         Retrieve logged messages, optionally filtered by level.
 
+        Messages are merged with their ``%``-style arguments here, on read, the same way
+        ``logging.LogRecord.getMessage`` would, so recording a call never formats anything.
+
         Args:
             level: The log level to filter by (e.g., "debug", "info").
 
         Returns:
             A list of log messages.
         """
-        if level:
-            return [msg for lvl, msg, _, _ in self.calls if lvl == level]
-        return [msg for _, msg, _, _ in self.calls]
+        return [
+            self._render(msg, args)
+            for lvl, msg, args in zip(self._levels, self._messages, self._args)
+            if not level or lvl == level
+        ]
+
+    @staticmethod
+    def _render(message: str, args: Tuple) -> str:
+        """
+        Merge a message with its arguments like ``logging.LogRecord.getMessage``.
+
+        Arguments that do not match the placeholders leave the message unmerged, as logging's
+        ``handleError`` tolerates them instead of raising.
+        """
+        if not args:
+            return message
+        # logging treats a single mapping argument as the source of named placeholders
+        values: Any = args[0] if len(args) == 1 and isinstance(args[0], Mapping) and args[0] else args
+        try:
+            return str(message) % values
+        except (TypeError, ValueError, KeyError):
+            return message
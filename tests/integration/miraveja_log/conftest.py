@@ -0,0 +1,76 @@
+"""Shared fixtures for integration tests."""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+from miraveja_log.application import LoggerFactory
+from miraveja_log.infrastructure.adapters import AsyncPythonLoggerAdapter, PythonLoggerAdapter
+from miraveja_log.infrastructure.testing import MemoryHandler
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is not available on every platform
+    uvloop = None  # type: ignore[assignment]
+
+
+def pytest_asyncio_loop_factories() -> Dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run async integration tests on uvloop when it is installed, and on the default loop otherwise."""
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(scope="module")
+def factory() -> LoggerFactory:
+    """Provide one logger factory per test module; tests use distinct logger names."""
+    return LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
+
+
+@pytest.fixture
+def attach_memory_handler() -> Iterator[Callable[..., MemoryHandler]]:
+    """Attach MemoryHandlers to named loggers and detach them when the test ends."""
+    attached: List[Tuple[logging.Logger, MemoryHandler]] = []
+
+    def attach(name: str, formatter: Optional[logging.Formatter] = None) -> MemoryHandler:
+        handler = MemoryHandler()
+        if formatter is not None:
+            handler.setFormatter(formatter)
+        underlying_logger = logging.getLogger(name)
+        underlying_logger.addHandler(handler)
+        attached.append((underlying_logger, handler))
+        return handler
+
+    yield attach
+
+    for underlying_logger, handler in attached:
+        underlying_logger.removeHandler(handler)
+
+
+@pytest.fixture
+def flush_file_handlers() -> Callable[..., None]:
+    """Flush the file handlers of the named loggers, once per distinct handler."""
+
+    def flush(*names: str) -> None:
+        # Loggers writing to the same file share one handler, so dedupe before flushing
+        handlers = dict.fromkeys(
+            handler
+            for name in names
+            for handler in logging.getLogger(name).handlers
+            if isinstance(handler, logging.FileHandler)
+        )
+        for handler in handlers:
+            handler.flush()
+
+    return flush
+
+
+@pytest.fixture
+def close_shared_file_handlers(tmp_path: Path) -> Iterator[None]:
+    """Close and unregister the shared file handlers opened under this test's tmp_path."""
+    yield
+
+    PythonLoggerAdapter.release_file_handlers(tmp_path)
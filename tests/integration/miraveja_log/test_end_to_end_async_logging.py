@@ -2,7 +2,10 @@
 
 import asyncio
 import logging
+import sys
+import threading
 from pathlib import Path
+from typing import Callable, Optional
 
 import pytest
 
@@ -11,15 +14,29 @@ from miraveja_log.domain import IAsyncLogger, LogLevel, OutputTarget
 from miraveja_log.infrastructure.adapters import AsyncPythonLoggerAdapter, PythonLoggerAdapter
 from miraveja_log.infrastructure.testing import MemoryHandler
 
+# (IAsyncLogger method, message) pairs, one per level from least to most severe
+_LEVEL_CALLS = (
+    ("debug", "Async debug message"),
+    ("info", "Async info message"),
+    ("warning", "Async warning message"),
+    ("error", "Async error message"),
+    ("critical", "Async critical message"),
+)
+
+
+@pytest.fixture(scope="module")
+def async_log_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide one log directory for every file-target test in this module."""
+    return tmp_path_factory.mktemp("async_logs")
+
 
 class TestEndToEndAsyncLogging:
     """Test complete asynchronous logging workflow from factory to output."""
 
     @pytest.mark.asyncio
-    async def test_create_async_logger_with_factory(self) -> None:
+    async def test_create_async_logger_with_factory(self, factory: LoggerFactory) -> None:
         """Test creating an async logger using factory with default config."""
         config = LoggerConfig(name="test_async_logger")
-        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
 
         logger = factory.get_or_create_async_logger(config)
 
@@ -27,48 +44,34 @@ class TestEndToEndAsyncLogging:
         assert isinstance(logger, IAsyncLogger)
 
     @pytest.mark.asyncio
-    async def test_async_logger_logs_all_levels(self) -> None:
+    async def test_async_logger_logs_all_levels(
+        self, factory: LoggerFactory, attach_memory_handler: Callable[..., MemoryHandler]
+    ) -> None:
         """Test that async logger can log at all severity levels."""
         config = LoggerConfig(name="test_async_all_levels")
-        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
         logger = factory.get_or_create_async_logger(config)
 
-        # Add memory handler to capture logs
-        memory_handler = MemoryHandler()
-        underlying_logger = logging.getLogger(config.name)
-        underlying_logger.addHandler(memory_handler)
+        memory_handler = attach_memory_handler(config.name)
 
         # Log at all levels asynchronously
-        await logger.debug("Async debug message")
-        await logger.info("Async info message")
-        await logger.warning("Async warning message")
-        await logger.error("Async error message")
-        await logger.critical("Async critical message")
-
-        messages = memory_handler.get_messages()
-        assert len(messages) == 5
+        for method_name, message in _LEVEL_CALLS:
+            await getattr(logger, method_name)(message)
 
-        # Clean up
-        underlying_logger.removeHandler(memory_handler)
+        assert len(memory_handler.records) == 5
 
     @pytest.mark.asyncio
-    async def test_async_logger_respects_log_level_filtering(self) -> None:
+    async def test_async_logger_respects_log_level_filtering(
+        self, factory: LoggerFactory, attach_memory_handler: Callable[..., MemoryHandler]
+    ) -> None:
         """Test that async log level filtering works correctly."""
         config = LoggerConfig(name="test_async_level_filter", level=LogLevel.ERROR)
-        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
         logger = factory.get_or_create_async_logger(config)
 
-        # Add memory handler
-        memory_handler = MemoryHandler()
-        underlying_logger = logging.getLogger(config.name)
-        underlying_logger.addHandler(memory_handler)
+        memory_handler = attach_memory_handler(config.name)
 
         # Log at all levels
-        await logger.debug("Async debug message")
-        await logger.info("Async info message")
-        await logger.warning("Async warning message")
-        await logger.error("Async error message")
-        await logger.critical("Async critical message")
+        for method_name, message in _LEVEL_CALLS:
+            await getattr(logger, method_name)(message)
 
         messages = memory_handler.get_messages()
         # Only ERROR and CRITICAL should be logged
@@ -76,43 +79,32 @@ class TestEndToEndAsyncLogging:
         assert "Async error message" in messages[0]
         assert "Async critical message" in messages[1]
 
-        # Clean up
-        underlying_logger.removeHandler(memory_handler)
-
     @pytest.mark.asyncio
-    async def test_async_logger_with_custom_format(self) -> None:
+    async def test_async_logger_with_custom_format(
+        self, factory: LoggerFactory, attach_memory_handler: Callable[..., MemoryHandler]
+    ) -> None:
         """Test async logger with custom log format."""
         custom_format = "[%(levelname)s] %(message)s"
-        config = LoggerConfig(name="test_async_custom_format", format=custom_format)
-        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
+        config = LoggerConfig(name="test_async_custom_format", log_format=custom_format)
         logger = factory.get_or_create_async_logger(config)
 
-        # Add memory handler
-        memory_handler = MemoryHandler()
-        memory_handler.setFormatter(logging.Formatter(custom_format))
-        underlying_logger = logging.getLogger(config.name)
-        underlying_logger.addHandler(memory_handler)
+        memory_handler = attach_memory_handler(config.name, logging.Formatter(custom_format))
 
         await logger.info("Async test message")
 
-        messages = memory_handler.get_messages()
-        assert len(messages) == 1
-        assert "[INFO] Async test message" in messages[0]
-
-        # Clean up
-        underlying_logger.removeHandler(memory_handler)
+        assert len(memory_handler.records) == 1
+        message = memory_handler.format(memory_handler.records[0])
+        assert "[INFO] Async test message" in message
 
     @pytest.mark.asyncio
-    async def test_async_logger_with_extra_fields(self) -> None:
+    async def test_async_logger_with_extra_fields(
+        self, factory: LoggerFactory, attach_memory_handler: Callable[..., MemoryHandler]
+    ) -> None:
         """Test async logger with structured logging (extra fields)."""
         config = LoggerConfig(name="test_async_extra_fields")
-        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
         logger = factory.get_or_create_async_logger(config)
 
-        # Add memory handler
-        memory_handler = MemoryHandler()
-        underlying_logger = logging.getLogger(config.name)
-        underlying_logger.addHandler(memory_handler)
+        memory_handler = attach_memory_handler(config.name)
 
         # Log with extra fields
         await logger.info("Async user action", extra={"user_id": "456", "action": "logout"})
@@ -123,14 +115,10 @@ class TestEndToEndAsyncLogging:
         assert records[0].user_id == "456"
         assert records[0].action == "logout"
 
-        # Clean up
-        underlying_logger.removeHandler(memory_handler)
-
     @pytest.mark.asyncio
-    async def test_async_logger_caching_returns_same_instance(self) -> None:
+    async def test_async_logger_caching_returns_same_instance(self, factory: LoggerFactory) -> None:
         """Test that factory returns cached async logger for same name."""
         config = LoggerConfig(name="test_async_cached_logger")
-        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
 
         logger1 = factory.get_or_create_async_logger(config)
         logger2 = factory.get_or_create_async_logger(config)
@@ -138,11 +126,10 @@ class TestEndToEndAsyncLogging:
         assert logger1 is logger2
 
     @pytest.mark.asyncio
-    async def test_async_logger_different_names_create_different_instances(self) -> None:
+    async def test_async_logger_different_names_create_different_instances(self, factory: LoggerFactory) -> None:
         """Test that different async logger names create different instances."""
         config1 = LoggerConfig(name="test_async_logger_1")
         config2 = LoggerConfig(name="test_async_logger_2")
-        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
 
         logger1 = factory.get_or_create_async_logger(config1)
         logger2 = factory.get_or_create_async_logger(config2)
@@ -150,92 +137,82 @@ class TestEndToEndAsyncLogging:
         assert logger1 is not logger2
 
     @pytest.mark.asyncio
-    async def test_async_logger_with_positional_args(self) -> None:
+    async def test_async_logger_with_positional_args(
+        self, factory: LoggerFactory, attach_memory_handler: Callable[..., MemoryHandler]
+    ) -> None:
         """Test async logger with positional arguments for string formatting."""
         config = LoggerConfig(name="test_async_positional_args")
-        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
         logger = factory.get_or_create_async_logger(config)
 
-        # Add memory handler
-        memory_handler = MemoryHandler()
-        underlying_logger = logging.getLogger(config.name)
-        underlying_logger.addHandler(memory_handler)
+        memory_handler = attach_memory_handler(config.name)
 
         await logger.info("Async user %s logged in at %s", "jane_doe", "2025-11-20")
 
-        messages = memory_handler.get_messages()
-        assert len(messages) == 1
-        assert "jane_doe" in messages[0]
-        assert "2025-11-20" in messages[0]
-
-        # Clean up
-        underlying_logger.removeHandler(memory_handler)
+        assert len(memory_handler.records) == 1
+        message = memory_handler.format(memory_handler.records[0])
+        assert "jane_doe" in message
+        assert "2025-11-20" in message
 
     @pytest.mark.asyncio
-    async def test_async_logger_with_exception_info(self) -> None:
+    async def test_async_logger_with_exception_info(
+        self, factory: LoggerFactory, attach_memory_handler: Callable[..., MemoryHandler]
+    ) -> None:
         """Test async logger with exception information."""
         config = LoggerConfig(name="test_async_exception_info")
-        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
         logger = factory.get_or_create_async_logger(config)
 
-        # Add memory handler
-        memory_handler = MemoryHandler()
-        underlying_logger = logging.getLogger(config.name)
-        underlying_logger.addHandler(memory_handler)
+        memory_handler = attach_memory_handler(config.name)
 
         try:
             raise ValueError("Async test exception")
         except ValueError:
             await logger.error("An async error occurred", exc_info=True)
 
-        messages = memory_handler.get_messages()
-        assert len(messages) == 1
-        assert "An async error occurred" in messages[0]
-        assert "ValueError: Async test exception" in messages[0]
-        assert "Traceback" in messages[0]
-
-        # Clean up
-        underlying_logger.removeHandler(memory_handler)
+        assert len(memory_handler.records) == 1
+        record = memory_handler.records[0]
+        assert record.getMessage() == "An async error occurred"
+        assert record.exc_info is not None
+        exc_type, exc, traceback = record.exc_info
+        assert exc_type is ValueError
+        assert str(exc) == "Async test exception"
+        assert traceback is not None
 
     @pytest.mark.asyncio
-    async def test_concurrent_async_logging(self) -> None:
+    async def test_concurrent_async_logging(
+        self, factory: LoggerFactory, attach_memory_handler: Callable[..., MemoryHandler]
+    ) -> None:
         """Test that concurrent async logging works correctly."""
         config = LoggerConfig(name="test_concurrent_async")
-        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
         logger = factory.get_or_create_async_logger(config)
 
-        # Add memory handler
-        memory_handler = MemoryHandler()
-        underlying_logger = logging.getLogger(config.name)
-        underlying_logger.addHandler(memory_handler)
-
-        # Log concurrently
-        async def log_task(task_id: int) -> None:
-            await logger.info(f"Task {task_id} executing")
-
-        await asyncio.gather(*[log_task(i) for i in range(10)])
+        memory_handler = attach_memory_handler(config.name)
 
-        messages = memory_handler.get_messages()
-        assert len(messages) == 10
+        # Log concurrently, leaving %-interpolation to the logger
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as task_group:
+                for task_id in range(10):
+                    task_group.create_task(logger.info("Task %d executing", task_id))
+        else:
+            await asyncio.gather(*(logger.info("Task %d executing", task_id) for task_id in range(10)))
 
-        # Clean up
-        underlying_logger.removeHandler(memory_handler)
+        assert len(memory_handler.records) == 10
+        assert sorted(record.getMessage() for record in memory_handler.records) == sorted(
+            f"Task {task_id} executing" for task_id in range(10)
+        )
 
     @pytest.mark.asyncio
-    async def test_multiple_async_loggers_operate_independently(self) -> None:
+    async def test_multiple_async_loggers_operate_independently(
+        self, factory: LoggerFactory, attach_memory_handler: Callable[..., MemoryHandler]
+    ) -> None:
         """Test that multiple async loggers operate independently."""
         config1 = LoggerConfig(name="test_async_independent_1")
         config2 = LoggerConfig(name="test_async_independent_2")
-        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
 
         logger1 = factory.get_or_create_async_logger(config1)
         logger2 = factory.get_or_create_async_logger(config2)
 
-        # Add memory handlers
-        handler1 = MemoryHandler()
-        handler2 = MemoryHandler()
-        logging.getLogger(config1.name).addHandler(handler1)
-        logging.getLogger(config2.name).addHandler(handler2)
+        handler1 = attach_memory_handler(config1.name)
+        handler2 = attach_memory_handler(config2.name)
 
         await logger1.info("Async logger 1 message")
         await logger2.info("Async logger 2 message")
@@ -248,61 +225,38 @@ class TestEndToEndAsyncLogging:
         assert "Async logger 1 message" in messages1[0]
         assert "Async logger 2 message" in messages2[0]
 
-        # Clean up
-        logging.getLogger(config1.name).removeHandler(handler1)
-        logging.getLogger(config2.name).removeHandler(handler2)
-
     @pytest.mark.asyncio
-    async def test_async_logger_with_all_output_targets(self) -> None:
+    @pytest.mark.parametrize(
+        "output_target, filename",
+        [
+            (OutputTarget.CONSOLE, None),
+            (OutputTarget.FILE, "test.log"),
+            (OutputTarget.JSON, "test.json"),
+        ],
+    )
+    async def test_async_logger_with_all_output_targets(
+        self, factory: LoggerFactory, async_log_dir: Path, output_target: OutputTarget, filename: Optional[str]
+    ) -> None:
         """Test that async logger can be created with all output targets."""
-        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
-
-        # Console target
-        config_console = LoggerConfig(name="test_async_console", output_target=OutputTarget.CONSOLE)
-        logger_console = factory.get_or_create_async_logger(config_console)
-        assert logger_console is not None
-
-        # File target (with temp directory)
-        temp_dir = Path("./temp_logs_async")
-        temp_dir.mkdir(exist_ok=True)
-        config_file = LoggerConfig(
-            name="test_async_file",
-            output_target=OutputTarget.FILE,
-            directory=temp_dir,
-            filename="test.log",
-        )
-        logger_file = factory.get_or_create_async_logger(config_file)
-        assert logger_file is not None
-
-        # JSON target
-        config_json = LoggerConfig(
-            name="test_async_json",
-            output_target=OutputTarget.JSON,
-            directory=temp_dir,
-            filename="test.json",
+        config = LoggerConfig(
+            name=f"test_async_{output_target.lower()}",
+            output_target=output_target,
+            directory=async_log_dir if filename else None,
+            filename=filename,
         )
-        logger_json = factory.get_or_create_async_logger(config_json)
-        assert logger_json is not None
-
-        # Clean up - close all handlers first to release file locks
-        import logging
-        import shutil
-
-        for logger_name in ["test_async_file", "test_async_json"]:
-            logger = logging.getLogger(logger_name)
-            for handler in logger.handlers[:]:
-                if isinstance(handler, logging.FileHandler):
-                    handler.close()
-                    logger.removeHandler(handler)
+        logger = factory.get_or_create_async_logger(config)
+        assert logger is not None
 
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
+        if filename:
+            await logger.info("Async target message")
+            # Drain the queue listener so the record reaches the file
+            logger.close()
+            assert "Async target message" in (async_log_dir / filename).read_text()
 
     @pytest.mark.asyncio
-    async def test_mixed_sync_async_loggers_separate_caches(self) -> None:
+    async def test_mixed_sync_async_loggers_separate_caches(self, factory: LoggerFactory) -> None:
         """Test that sync and async loggers maintain separate caches."""
         config = LoggerConfig(name="test_mixed_logger")
-        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
 
         sync_logger = factory.get_or_create_logger(config)
         async_logger = factory.get_or_create_async_logger(config)
@@ -310,3 +264,39 @@ class TestEndToEndAsyncLogging:
         # They should be different instances
         assert sync_logger is not async_logger
         assert type(sync_logger).__name__ != type(async_logger).__name__
+
+    def test_clear_cache_stops_async_logger_listeners(self) -> None:
+        """Test that recreating async loggers after clear_cache does not accumulate listener threads."""
+        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
+        config = LoggerConfig(name="test_async_clear_cache_cycles")
+        baseline_threads = threading.active_count()
+
+        for _ in range(20):
+            factory.get_or_create_async_logger(config)
+            factory.clear_cache()
+
+        assert threading.active_count() == baseline_threads
+
+    @pytest.mark.asyncio
+    async def test_held_async_logger_keeps_writing_after_clear_cache(self, tmp_path: Path) -> None:
+        """Test that an async file logger still held by the caller writes to its file after clear_cache."""
+        factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
+        config = LoggerConfig(
+            name="test_async_held_after_clear_cache",
+            output_target=OutputTarget.FILE,
+            directory=str(tmp_path),
+            filename="held.log",
+        )
+        logger = factory.get_or_create_async_logger(config)
+
+        await logger.info("before clear")
+        factory.clear_cache()
+        for index in range(3):
+            await logger.info(f"after clear {index}")
+        logger.close()
+        for handler in logging.getLogger(config.name).handlers:
+            handler.flush()
+
+        content = (tmp_path / "held.log").read_text()
+        assert "before clear" in content
+        assert all(f"after clear {index}" in content for index in range(3))
@@ -43,8 +43,7 @@ class TestEndToEndSyncLogging:
         logger.error("Error message")
         logger.critical("Critical message")
 
-        messages = memory_handler.get_messages()
-        assert len(messages) == 5
+        assert len(memory_handler.records) == 5
 
         # Clean up
         underlying_logger.removeHandler(memory_handler)
@@ -78,7 +77,7 @@ class TestEndToEndSyncLogging:
     def test_sync_logger_with_custom_format(self) -> None:
         """Test sync logger with custom log format."""
         custom_format = "%(levelname)s | %(message)s"
-        config = LoggerConfig(name="test_custom_format", format=custom_format)
+        config = LoggerConfig(name="test_custom_format", log_format=custom_format)
         factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
         logger = factory.get_or_create_logger(config)
 
@@ -90,9 +89,9 @@ class TestEndToEndSyncLogging:
 
         logger.info("Test message")
 
-        messages = memory_handler.get_messages()
-        assert len(messages) == 1
-        assert "INFO | Test message" in messages[0]
+        assert len(memory_handler.records) == 1
+        message = memory_handler.format(memory_handler.records[0])
+        assert "INFO | Test message" in message
 
         # Clean up
         underlying_logger.removeHandler(memory_handler)
@@ -165,10 +164,10 @@ class TestEndToEndSyncLogging:
 
         logger.info("User %s logged in at %s", "john_doe", "2025-11-20")
 
-        messages = memory_handler.get_messages()
-        assert len(messages) == 1
-        assert "john_doe" in messages[0]
-        assert "2025-11-20" in messages[0]
+        assert len(memory_handler.records) == 1
+        message = memory_handler.format(memory_handler.records[0])
+        assert "john_doe" in message
+        assert "2025-11-20" in message
 
         # Clean up
         underlying_logger.removeHandler(memory_handler)
@@ -189,11 +188,11 @@ class TestEndToEndSyncLogging:
         except ValueError:
             logger.error("An error occurred", exc_info=True)
 
-        messages = memory_handler.get_messages()
-        assert len(messages) == 1
-        assert "An error occurred" in messages[0]
-        assert "ValueError: Test exception" in messages[0]
-        assert "Traceback" in messages[0]
+        assert len(memory_handler.records) == 1
+        message = memory_handler.format(memory_handler.records[0])
+        assert "An error occurred" in message
+        assert "ValueError: Test exception" in message
+        assert "Traceback" in message
 
         # Clean up
         underlying_logger.removeHandler(memory_handler)
@@ -210,8 +209,10 @@ class TestEndToEndSyncLogging:
         # Add memory handlers
         handler1 = MemoryHandler()
         handler2 = MemoryHandler()
-        logging.getLogger(config1.name).addHandler(handler1)
-        logging.getLogger(config2.name).addHandler(handler2)
+        underlying_logger1 = logging.getLogger(config1.name)
+        underlying_logger2 = logging.getLogger(config2.name)
+        underlying_logger1.addHandler(handler1)
+        underlying_logger2.addHandler(handler2)
 
         logger1.info("Logger 1 message")
         logger2.info("Logger 2 message")
@@ -225,10 +226,10 @@ class TestEndToEndSyncLogging:
         assert "Logger 2 message" in messages2[0]
 
         # Clean up
-        logging.getLogger(config1.name).removeHandler(handler1)
-        logging.getLogger(config2.name).removeHandler(handler2)
+        underlying_logger1.removeHandler(handler1)
+        underlying_logger2.removeHandler(handler2)
 
-    def test_sync_logger_with_all_output_targets(self) -> None:
+    def test_sync_logger_with_all_output_targets(self, tmp_path: Path) -> None:
         """Test that sync logger can be created with all output targets."""
         factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
 
@@ -237,13 +238,11 @@ class TestEndToEndSyncLogging:
         logger_console = factory.get_or_create_logger(config_console)
         assert logger_console is not None
 
-        # File target (with temp directory)
-        temp_dir = Path("./temp_logs_sync")
-        temp_dir.mkdir(exist_ok=True)
+        # File target
         config_file = LoggerConfig(
             name="test_file",
             output_target=OutputTarget.FILE,
-            directory=temp_dir,
+            directory=tmp_path,
             filename="test.log",
         )
         logger_file = factory.get_or_create_logger(config_file)
@@ -253,22 +252,16 @@ class TestEndToEndSyncLogging:
         config_json = LoggerConfig(
             name="test_json",
             output_target=OutputTarget.JSON,
-            directory=temp_dir,
+            directory=tmp_path,
             filename="test.json",
         )
         logger_json = factory.get_or_create_logger(config_json)
         assert logger_json is not None
 
-        # Clean up - close all handlers first to release file locks
-        import logging
-        import shutil
-
+        # Close the file handlers so tmp_path can be removed on every platform
         for logger_name in ["test_file", "test_json"]:
             logger = logging.getLogger(logger_name)
             for handler in logger.handlers[:]:
                 if isinstance(handler, logging.FileHandler):
                     handler.close()
                     logger.removeHandler(handler)
-
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
@@ -2,7 +2,9 @@
 
 import logging
 import shutil
+import sys
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
@@ -98,10 +100,11 @@ class TestErrorScenarios:
 
         finally:
             # Clean up
-            for handler in logging.getLogger(config.name).handlers[:]:
+            underlying_logger = logging.getLogger(config.name)
+            for handler in underlying_logger.handlers[:]:
                 if isinstance(handler, logging.FileHandler):
                     handler.close()
-                    logging.getLogger(config.name).removeHandler(handler)
+                    underlying_logger.removeHandler(handler)
             if temp_dir.exists():
                 shutil.rmtree(temp_dir)
 
@@ -109,8 +112,6 @@ class TestErrorScenarios:
         """Test that logger handles readonly directory gracefully."""
         # This test is platform-specific and may behave differently
         # Skip on Windows where setting readonly is complex
-        import sys
-
         if sys.platform == "win32":
             pytest.skip("Readonly directory test not reliable on Windows")
 
@@ -212,8 +213,6 @@ class TestErrorScenarios:
             factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
             logger = factory.get_or_create_logger(config)
 
-            import threading
-
             def log_messages(thread_id: int) -> None:
                 for i in range(10):
                     logger.info(f"Thread {thread_id} message {i}")
@@ -226,6 +225,10 @@ class TestErrorScenarios:
             for thread in threads:
                 thread.join()
 
+            # Flush the buffered handler
+            for handler in logging.getLogger(config.name).handlers:
+                handler.flush()
+
             # Verify file was created and has content
             log_path = temp_dir / log_file
             assert log_path.exists()
@@ -234,10 +237,57 @@ class TestErrorScenarios:
 
         finally:
             # Clean up
-            for handler in logging.getLogger(config.name).handlers[:]:
-                if isinstance(handler, logging.FileHandler):
-                    handler.close()
-                    logging.getLogger(config.name).removeHandler(handler)
+            logging.getLogger(config.name).handlers.clear()
+            PythonLoggerAdapter.release_file_handlers(temp_dir)
+            if temp_dir.exists():
+                shutil.rmtree(temp_dir)
+
+    def test_concurrent_file_access_with_queue(self) -> None:
+        """Test concurrent access to same log file through the queued write path."""
+        temp_dir = Path(tempfile.mkdtemp())
+        log_file = "concurrent_queued.log"
+
+        try:
+            # Threads only enqueue records; one listener thread owns the file handler
+            config = LoggerConfig(
+                name="test_concurrent_queued",
+                output_target=OutputTarget.FILE,
+                directory=temp_dir,
+                filename=log_file,
+                use_queue=True,
+            )
+            factory = LoggerFactory(PythonLoggerAdapter, AsyncPythonLoggerAdapter)
+            logger = factory.get_or_create_logger(config)
+            assert isinstance(logger, PythonLoggerAdapter)
+
+            def log_messages(thread_id: int) -> None:
+                for i in range(10):
+                    logger.info("Thread %d message %d", thread_id, i)
+
+            threads = [threading.Thread(target=log_messages, args=(i,)) for i in range(5)]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+            # Stop the listener, draining every queued record to the file
+            logger.close()
+
+            # Verify every record from every thread reached the file
+            log_path = temp_dir / log_file
+            assert log_path.exists()
+            lines = log_path.read_text().splitlines()
+            assert len(lines) == 50
+            for thread_id in range(5):
+                for i in range(10):
+                    assert any(line.endswith(f"Thread {thread_id} message {i}") for line in lines)
+
+        finally:
+            # Clean up; close() moved the file handler back onto the logger
+            logging.getLogger(config.name).handlers.clear()
+            PythonLoggerAdapter.release_file_handlers(temp_dir)
             if temp_dir.exists():
                 shutil.rmtree(temp_dir)
 
@@ -307,10 +357,11 @@ class TestErrorScenarios:
 
         finally:
             # Clean up
-            for handler in logging.getLogger(config.name).handlers[:]:
+            underlying_logger = logging.getLogger(config.name)
+            for handler in underlying_logger.handlers[:]:
                 if isinstance(handler, logging.FileHandler):
                     handler.close()
-                    logging.getLogger(config.name).removeHandler(handler)
+                    underlying_logger.removeHandler(handler)
             if temp_dir.exists():
                 shutil.rmtree(temp_dir)
 
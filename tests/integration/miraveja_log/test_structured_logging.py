@@ -179,10 +179,11 @@ class TestStructuredLogging:
 
         finally:
             # Clean up
-            for handler in logging.getLogger(config.name).handlers[:]:
+            underlying_logger = logging.getLogger(config.name)
+            for handler in underlying_logger.handlers[:]:
                 if isinstance(handler, logging.FileHandler):
                     handler.close()
-                    logging.getLogger(config.name).removeHandler(handler)
+                    underlying_logger.removeHandler(handler)
             if temp_dir.exists():
                 shutil.rmtree(temp_dir)
 
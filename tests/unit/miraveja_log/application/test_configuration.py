@@ -1,11 +1,11 @@
 """Unit tests for application configuration."""
 
+import dataclasses
 import os
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-from pydantic import ValidationError
 
 from miraveja_log.application.configuration import LoggerConfig
 from miraveja_log.domain.enums import LogLevel, OutputTarget
@@ -16,7 +16,7 @@ class TestLoggerConfigBasics:
 
     def test_logger_config_requires_name(self) -> None:
         """Test that LoggerConfig requires a name field."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(TypeError):
             LoggerConfig()  # type: ignore
 
     def test_logger_config_defaults_to_info_level(self) -> None:
@@ -49,6 +49,38 @@ class TestLoggerConfigBasics:
         config = LoggerConfig(name="test")
         assert config.filename is None
 
+    def test_logger_config_has_default_buffer_settings(self) -> None:
+        """Test that LoggerConfig has default file buffering settings."""
+        config = LoggerConfig(name="test")
+        assert config.buffer_capacity == 65536
+        assert config.flush_interval_ms == 200
+
+    def test_logger_config_flush_on_sigterm_defaults_to_false(self) -> None:
+        """Test that no SIGTERM handler is requested unless the application opts in."""
+        config = LoggerConfig(name="test")
+        assert config.flush_on_sigterm is False
+
+    def test_logger_config_use_queue_defaults_to_false(self) -> None:
+        """Test that synchronous loggers write on the calling thread by default."""
+        config = LoggerConfig(name="test")
+        assert config.use_queue is False
+
+    def test_logger_config_interns_name(self) -> None:
+        """Test that configs built from equal but distinct name strings share one interned name."""
+        first = LoggerConfig(name="".join(["interned", "_logger"]))
+        second = LoggerConfig(name="".join(["interned", "_", "logger"]))
+        assert first.name is second.name
+
+    def test_logger_config_rejects_non_positive_buffer_capacity(self) -> None:
+        """Test that buffer_capacity must be positive."""
+        with pytest.raises(ValueError):
+            LoggerConfig(name="test", buffer_capacity=0)
+
+    def test_logger_config_rejects_negative_flush_interval(self) -> None:
+        """Test that flush_interval_ms cannot be negative."""
+        with pytest.raises(ValueError, match="flush_interval_ms"):
+            LoggerConfig(name="test", flush_interval_ms=-1)
+
     def test_logger_config_can_be_created_with_all_fields(self) -> None:
         """Test that LoggerConfig can be created with all fields specified."""
         config = LoggerConfig(
@@ -75,22 +107,22 @@ class TestLoggerConfigValidation:
 
     def test_logger_config_validates_directory_for_file_target(self) -> None:
         """Test that directory is required for FILE target."""
-        with pytest.raises(ValidationError, match="directory must be provided"):
+        with pytest.raises(ValueError, match="directory must be provided"):
             LoggerConfig(name="test", output_target=OutputTarget.FILE, directory=None, filename="test.log")
 
     def test_logger_config_validates_filename_for_file_target(self) -> None:
         """Test that filename is required for FILE target."""
-        with pytest.raises(ValidationError, match="filename must be provided"):
+        with pytest.raises(ValueError, match="filename must be provided"):
             LoggerConfig(name="test", output_target=OutputTarget.FILE, directory=Path("./logs"))
 
     def test_logger_config_validates_directory_for_json_target(self) -> None:
         """Test that directory is required for JSON target."""
-        with pytest.raises(ValidationError, match="directory must be provided"):
+        with pytest.raises(ValueError, match="directory must be provided"):
             LoggerConfig(name="test", output_target=OutputTarget.JSON, filename="test.json")
 
     def test_logger_config_validates_filename_for_json_target(self) -> None:
         """Test that filename is required for JSON target."""
-        with pytest.raises(ValidationError, match="filename must be provided"):
+        with pytest.raises(ValueError, match="filename must be provided"):
             LoggerConfig(name="test", output_target=OutputTarget.JSON, directory=Path("./logs"))
 
     def test_logger_config_allows_none_directory_for_console_target(self) -> None:
@@ -274,8 +306,8 @@ class TestLoggerConfigEdgeCases:
         assert config.directory == Path("C:/logs")
         assert config.get_full_path() == Path("C:/logs/app.log")
 
-    def test_logger_config_model_dump(self) -> None:
-        """Test that LoggerConfig can be dumped to dictionary."""
+    def test_logger_config_as_dict(self) -> None:
+        """Test that LoggerConfig can be converted to a dictionary."""
         config = LoggerConfig(
             name="test",
             level=LogLevel.DEBUG,
@@ -283,8 +315,32 @@ class TestLoggerConfigEdgeCases:
             directory=Path("./logs"),
             filename="app.log",
         )
-        dumped = config.model_dump()
+        dumped = dataclasses.asdict(config)
 
         assert dumped["name"] == "test"
         assert dumped["level"] == LogLevel.DEBUG
         assert dumped["output_target"] == OutputTarget.FILE
+
+    def test_logger_config_is_frozen(self) -> None:
+        """Test that LoggerConfig instances are immutable."""
+        config = LoggerConfig(name="test")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.level = LogLevel.ERROR  # type: ignore[misc]
+
+    def test_logger_config_is_hashable(self) -> None:
+        """Test that equal configurations hash equally."""
+        config1 = LoggerConfig(name="test", level=LogLevel.INFO)
+        config2 = LoggerConfig(name="test", level=LogLevel.INFO)
+        assert config1 == config2
+        assert hash(config1) == hash(config2)
+
+    def test_logger_config_has_no_instance_dict(self) -> None:
+        """Test that LoggerConfig uses slots instead of a per-instance __dict__."""
+        config = LoggerConfig(name="test")
+        assert not hasattr(config, "__dict__")
+
+    def test_logger_config_converts_string_enums(self) -> None:
+        """Test that string level and target values are converted to enums."""
+        config = LoggerConfig(name="test", level="ERROR", output_target="CONSOLE")  # type: ignore[arg-type]
+        assert config.level is LogLevel.ERROR
+        assert config.output_target is OutputTarget.CONSOLE
@@ -2,7 +2,7 @@
 
 import threading
 from typing import Dict
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -385,6 +385,21 @@ class TestLoggerFactoryClearCache:
         assert len(factory._sync_logger_cache) == 0
         assert len(factory._async_logger_cache) == 0
 
+    def test_clear_cache_keeps_fast_path_lookups_bound_to_live_caches(self) -> None:
+        """Test that clear_cache empties the caches in place so the fast path sees new entries."""
+        factory = LoggerFactory(
+            logger_implementation=MockLogger,
+            async_logger_implementation=MockAsyncLogger,
+        )
+        config = LoggerConfig(name="test_logger", level=LogLevel.INFO)
+
+        factory.get_or_create_logger(config)
+        factory.clear_cache()
+        logger = factory.get_or_create_logger(config)
+
+        assert factory._get_cached_logger(config.name) is logger
+        assert factory._get_cached_async_logger(config.name) is None
+
     def test_can_create_logger_after_clear_cache(self) -> None:
         """Test that loggers can be created after calling clear_cache."""
         factory = LoggerFactory(
@@ -400,6 +415,22 @@ class TestLoggerFactoryClearCache:
         assert logger1 is not logger2
         assert isinstance(logger2, MockLogger)
 
+    def test_clear_cache_closes_cached_loggers(self) -> None:
+        """Test that clear_cache closes every cached sync and async logger."""
+        factory = LoggerFactory(
+            logger_implementation=MockLogger,
+            async_logger_implementation=MockAsyncLogger,
+        )
+        config = LoggerConfig(name="test_logger", level=LogLevel.INFO)
+
+        with patch.object(MockLogger, "close") as sync_close, patch.object(MockAsyncLogger, "close") as async_close:
+            factory.get_or_create_logger(config)
+            factory.get_or_create_async_logger(config)
+            factory.clear_cache()
+
+        sync_close.assert_called_once_with()
+        async_close.assert_called_once_with()
+
 
 class TestLoggerFactoryThreadSafety:
     """Test LoggerFactory thread safety."""
@@ -454,6 +485,22 @@ class TestLoggerFactoryThreadSafety:
         assert len(loggers) == 10
         assert all(logger is loggers[0] for logger in loggers)
 
+    def test_cache_hit_does_not_acquire_lock(self) -> None:
+        """Test that retrieving a cached logger skips the lock."""
+        factory = LoggerFactory(
+            logger_implementation=MockLogger,
+            async_logger_implementation=MockAsyncLogger,
+        )
+        config = LoggerConfig(name="test_logger", level=LogLevel.INFO)
+        sync_logger = factory.get_or_create_logger(config)
+        async_logger = factory.get_or_create_async_logger(config)
+
+        factory._lock = MagicMock()
+
+        assert factory.get_or_create_logger(config) is sync_logger
+        assert factory.get_or_create_async_logger(config) is async_logger
+        factory._lock.__enter__.assert_not_called()
+
     def test_concurrent_clear_cache_is_thread_safe(self) -> None:
         """Test that concurrent clear_cache calls are thread-safe."""
         factory = LoggerFactory(
@@ -216,3 +216,11 @@ class TestExceptionHierarchy:
         assert log_exc.message == "test message"
         assert "field" in config_exc.message
         assert "handler" in handler_exc.message
+
+    @pytest.mark.parametrize(
+        "exception",
+        [LogException("message"), ConfigurationException("field", "reason"), HandlerException("handler", "reason")],
+    )
+    def test_exception_attributes_are_stored_in_slots(self, exception: LogException) -> None:
+        """Test that exception attributes live in slots rather than the instance dictionary."""
+        assert exception.__dict__ == {}
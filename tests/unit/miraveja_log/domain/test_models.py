@@ -190,3 +190,7 @@ class TestLogEntry:
 
         serialized = entry.serialize()
         assert serialized["optional_field"] is None
+
+    def test_log_entry_schema_is_complete_without_rebuild(self) -> None:
+        """Test that LogEntry has no unresolved forward references and needs no model_rebuild()."""
+        assert LogEntry.__pydantic_complete__ is True
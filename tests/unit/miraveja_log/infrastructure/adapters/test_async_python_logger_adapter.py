@@ -1,11 +1,14 @@
 """Unit tests for AsyncPythonLoggerAdapter."""
 
+import logging
+
 import pytest
 
 from miraveja_log.application.configuration import LoggerConfig
 from miraveja_log.domain import IAsyncLogger, LogLevel
 from miraveja_log.infrastructure.adapters.async_python_logger_adapter import AsyncPythonLoggerAdapter
 from miraveja_log.infrastructure.adapters.python_logger_adapter import PythonLoggerAdapter
+from miraveja_log.infrastructure.handlers import LocalQueueHandler
 
 
 class TestAsyncPythonLoggerAdapterBasics:
@@ -33,6 +36,82 @@ class TestAsyncPythonLoggerAdapterBasics:
         assert adapter._sync_adapter is not None
         assert isinstance(adapter._sync_adapter, PythonLoggerAdapter)
 
+    def test_async_python_logger_adapter_uses_slots(self) -> None:
+        """Test that AsyncPythonLoggerAdapter instances carry no per-instance __dict__."""
+        config = LoggerConfig(name="test_async_logger")
+        adapter = AsyncPythonLoggerAdapter(config)
+
+        assert not hasattr(adapter, "__dict__")
+        with pytest.raises(AttributeError):
+            adapter.unexpected_attribute = True  # type: ignore[attr-defined]
+
+
+class TestAsyncPythonLoggerAdapterQueue:
+    """Test AsyncPythonLoggerAdapter queue-based delivery."""
+
+    def test_adapter_attaches_only_queue_handler(self) -> None:
+        """Test that the underlying logger only holds the queue handler."""
+        config = LoggerConfig(name="test_async_queue_handler")
+        adapter = AsyncPythonLoggerAdapter(config)
+
+        handlers = adapter._sync_adapter._logger.handlers
+        assert len(handlers) == 1
+        assert isinstance(handlers[0], LocalQueueHandler)
+
+    def test_listener_owns_real_handlers(self) -> None:
+        """Test that the queue listener owns the handlers built from the config."""
+        config = LoggerConfig(name="test_async_listener_handlers")
+        adapter = AsyncPythonLoggerAdapter(config)
+
+        assert len(adapter._listener.handlers) == 1
+        assert isinstance(adapter._listener.handlers[0], logging.StreamHandler)
+        assert adapter._listener.respect_handler_level is True
+
+    @pytest.mark.asyncio
+    async def test_records_reach_real_handlers_through_listener(self) -> None:
+        """Test that records logged asynchronously are delivered by the listener."""
+        config = LoggerConfig(name="test_async_listener_delivery")
+        adapter = AsyncPythonLoggerAdapter(config)
+
+        delivered: list[logging.LogRecord] = []
+        real_handler = adapter._listener.handlers[0]
+        real_handler.emit = delivered.append  # type: ignore[method-assign]
+
+        await adapter.info("Queued %s", "message")
+        adapter.close()
+
+        assert len(delivered) == 1
+        assert delivered[0].getMessage() == "Queued message"
+
+    @pytest.mark.asyncio
+    async def test_exc_info_true_captures_active_exception(self) -> None:
+        """Test that exc_info=True inside an except block delivers the handled exception."""
+        config = LoggerConfig(name="test_async_listener_exc_info")
+        adapter = AsyncPythonLoggerAdapter(config)
+
+        delivered: list[logging.LogRecord] = []
+        real_handler = adapter._listener.handlers[0]
+        real_handler.emit = delivered.append  # type: ignore[method-assign]
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            await adapter.error("Failed", exc_info=True)
+        adapter.close()
+
+        assert len(delivered) == 1
+        assert delivered[0].exc_info is not None
+        assert delivered[0].exc_info[0] is ValueError
+        assert str(delivered[0].exc_info[1]) == "boom"
+
+    def test_close_can_be_called_twice(self) -> None:
+        """Test that closing an already closed adapter is a no-op."""
+        config = LoggerConfig(name="test_async_close_twice")
+        adapter = AsyncPythonLoggerAdapter(config)
+
+        adapter.close()
+        adapter.close()
+
 
 class TestAsyncPythonLoggerAdapterLoggingMethods:
     """Test AsyncPythonLoggerAdapter logging methods."""
@@ -245,3 +324,40 @@ class TestAsyncPythonLoggerAdapterDelegation:
 
         await adapter.critical("Test message")
         assert call_count[0] == 1
+
+
+class TestAsyncPythonLoggerAdapterLevelGate:
+    """Test that disabled levels short-circuit before reaching the sync adapter."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_level_skips_sync_adapter(self) -> None:
+        """Test that a debug call on an INFO logger never reaches the sync adapter."""
+        config = LoggerConfig(name="test_async_level_gate", level=LogLevel.INFO)
+        adapter = AsyncPythonLoggerAdapter(config)
+
+        calls: list[str] = []
+        adapter._sync_adapter.debug = lambda *args, **kwargs: calls.append("debug")  # type: ignore[method-assign]
+        adapter._sync_adapter.info = lambda *args, **kwargs: calls.append("info")  # type: ignore[method-assign]
+
+        await adapter.debug("Filtered message")
+        await adapter.info("Delivered message")
+
+        assert calls == ["info"]
+
+    @pytest.mark.asyncio
+    async def test_all_levels_gated_by_logger_level(self) -> None:
+        """Test that only levels at or above the configured level are forwarded."""
+        config = LoggerConfig(name="test_async_level_gate_all", level=LogLevel.ERROR)
+        adapter = AsyncPythonLoggerAdapter(config)
+
+        calls: list[str] = []
+        for name in ("debug", "info", "warning", "error", "critical"):
+            setattr(adapter._sync_adapter, name, lambda *args, _name=name, **kwargs: calls.append(_name))
+
+        await adapter.debug("Debug")
+        await adapter.info("Info")
+        await adapter.warning("Warning")
+        await adapter.error("Error")
+        await adapter.critical("Critical")
+
+        assert calls == ["error", "critical"]
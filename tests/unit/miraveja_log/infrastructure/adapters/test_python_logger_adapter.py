@@ -1,5 +1,6 @@
 """Unit tests for PythonLoggerAdapter."""
 
+import dataclasses
 import logging
 import tempfile
 from pathlib import Path
@@ -9,7 +10,9 @@ import pytest
 
 from miraveja_log.application.configuration import LoggerConfig
 from miraveja_log.domain import ConfigurationException, ILogger, LogLevel, OutputTarget
+from miraveja_log.infrastructure.adapters import python_logger_adapter
 from miraveja_log.infrastructure.adapters.python_logger_adapter import PythonLoggerAdapter
+from miraveja_log.infrastructure.handlers import BufferedFileHandler, LocalQueueHandler, buffered_file_handler
 
 
 class TestPythonLoggerAdapterBasics:
@@ -86,6 +89,33 @@ class TestPythonLoggerAdapterConfiguration:
         assert handler.formatter is not None
 
 
+class TestPythonLoggerAdapterLevelConfiguration:
+    """Test how PythonLoggerAdapter applies the configured level."""
+
+    def test_level_mapper_covers_all_log_levels(self) -> None:
+        """Test that every LogLevel maps to the matching logging constant."""
+        for level in LogLevel:
+            assert PythonLoggerAdapter.LEVEL_MAPPER[level] == getattr(logging, level.value)
+
+    def test_unchanged_level_is_not_reapplied(self) -> None:
+        """Test that rebuilding an adapter with the same level does not call setLevel."""
+        config = LoggerConfig(name="test_logger_same_level", level=LogLevel.WARNING)
+        PythonLoggerAdapter(config)
+
+        with patch.object(logging.Logger, "setLevel") as mock_set_level:
+            PythonLoggerAdapter(config)
+
+        mock_set_level.assert_not_called()
+
+    def test_changed_level_is_applied(self) -> None:
+        """Test that rebuilding an adapter with a new level updates the logger."""
+        PythonLoggerAdapter(LoggerConfig(name="test_logger_new_level", level=LogLevel.WARNING))
+        adapter = PythonLoggerAdapter(LoggerConfig(name="test_logger_new_level", level=LogLevel.ERROR))
+
+        assert adapter._logger.level == logging.ERROR
+        assert not adapter._logger.isEnabledFor(logging.WARNING)
+
+
 class TestPythonLoggerAdapterConsoleOutput:
     """Test PythonLoggerAdapter with console output."""
 
@@ -150,6 +180,293 @@ class TestPythonLoggerAdapterFileOutput:
             adapter._logger.handlers.clear()
 
 
+class TestPythonLoggerAdapterSharedFileHandlers:
+    """Test sharing of file handlers between loggers writing to the same file."""
+
+    @staticmethod
+    def _file_config(name: str, directory: Path, **overrides: object) -> LoggerConfig:
+        """Build a FILE target config writing to shared.log in the given directory."""
+        return LoggerConfig(
+            name=name, output_target=OutputTarget.FILE, directory=directory, filename="shared.log", **overrides
+        )
+
+    def test_loggers_writing_same_file_share_handler(self, tmp_path: Path) -> None:
+        """Test that loggers with different names but the same file reuse one handler."""
+        first = PythonLoggerAdapter(self._file_config("shared_first", tmp_path))
+        second = PythonLoggerAdapter(self._file_config("shared_second", tmp_path))
+
+        assert first._logger.handlers[0] is second._logger.handlers[0]
+        first._logger.handlers[0].close()
+
+    def test_directory_is_created_only_on_cache_miss(self, tmp_path: Path) -> None:
+        """Test that reusing a shared handler skips directory creation."""
+        directory = tmp_path / "nested" / "logs"
+        first = PythonLoggerAdapter(self._file_config("shared_mkdir_first", directory))
+
+        with patch("miraveja_log.infrastructure.adapters.python_logger_adapter.os.makedirs") as makedirs:
+            second = PythonLoggerAdapter(self._file_config("shared_mkdir_second", directory))
+
+        assert directory.is_dir()
+        makedirs.assert_not_called()
+        assert first._logger.handlers[0] is second._logger.handlers[0]
+        first._logger.handlers[0].close()
+
+    def test_rebuilding_same_logger_keeps_attached_handler(self, tmp_path: Path) -> None:
+        """Test that an identical rebuild does not detach and re-attach the shared handler."""
+        first = PythonLoggerAdapter(self._file_config("shared_rebuild", tmp_path))
+        handler = first._logger.handlers[0]
+
+        with patch.object(logging.Logger, "addHandler") as mock_add_handler:
+            second = PythonLoggerAdapter(self._file_config("shared_rebuild", tmp_path))
+
+        mock_add_handler.assert_not_called()
+        assert second._logger.handlers == [handler]
+        handler.close()
+
+    def test_rebuilding_with_other_target_replaces_handler(self, tmp_path: Path) -> None:
+        """Test that rebuilding a logger for a different target swaps its handler."""
+        file_adapter = PythonLoggerAdapter(self._file_config("shared_retarget", tmp_path))
+        file_handler = file_adapter._logger.handlers[0]
+
+        console_adapter = PythonLoggerAdapter(LoggerConfig(name="shared_retarget"))
+
+        assert len(console_adapter._logger.handlers) == 1
+        assert console_adapter._logger.handlers[0] is not file_handler
+        file_handler.close()
+
+    def test_shared_handler_formats_each_logger_name(self, tmp_path: Path) -> None:
+        """Test that records from every sharing logger carry their own logger name."""
+        first = PythonLoggerAdapter(self._file_config("shared_name_first", tmp_path))
+        second = PythonLoggerAdapter(self._file_config("shared_name_second", tmp_path))
+
+        first.info("from first")
+        second.info("from second")
+        first._logger.handlers[0].close()
+
+        content = (tmp_path / "shared.log").read_text()
+        assert "shared_name_first - INFO - from first" in content
+        assert "shared_name_second - INFO - from second" in content
+
+    def test_different_format_uses_separate_handler(self, tmp_path: Path) -> None:
+        """Test that loggers with different formats do not share a handler."""
+        first = PythonLoggerAdapter(self._file_config("shared_fmt_first", tmp_path))
+        second = PythonLoggerAdapter(self._file_config("shared_fmt_second", tmp_path, log_format="%(message)s"))
+
+        assert first._logger.handlers[0] is not second._logger.handlers[0]
+        first._logger.handlers[0].close()
+        second._logger.handlers[0].close()
+
+    def test_closed_handler_is_replaced(self, tmp_path: Path) -> None:
+        """Test that a closed shared handler is not handed out again."""
+        first = PythonLoggerAdapter(self._file_config("shared_closed_first", tmp_path))
+        first._logger.handlers[0].close()
+        second = PythonLoggerAdapter(self._file_config("shared_closed_second", tmp_path))
+
+        assert first._logger.handlers[0] is not second._logger.handlers[0]
+        second._logger.handlers[0].close()
+
+    def test_handler_for_deleted_file_is_replaced(self, tmp_path: Path) -> None:
+        """Test that a handler whose file was removed is not reused."""
+        first = PythonLoggerAdapter(self._file_config("shared_deleted_first", tmp_path))
+        (tmp_path / "shared.log").unlink()
+        second = PythonLoggerAdapter(self._file_config("shared_deleted_second", tmp_path))
+
+        assert first._logger.handlers[0] is not second._logger.handlers[0]
+        first._logger.handlers[0].close()
+        second._logger.handlers[0].close()
+
+    def test_flush_on_sigterm_is_opt_in(self, tmp_path: Path) -> None:
+        """Test that only loggers configured with flush_on_sigterm register their handler for SIGTERM."""
+        with patch("miraveja_log.infrastructure.handlers.buffered_file_handler._install_sigterm_flush"):
+            default = PythonLoggerAdapter(self._file_config("shared_sigterm_default", tmp_path))
+            opted_in = PythonLoggerAdapter(self._file_config("shared_sigterm_opt_in", tmp_path, flush_on_sigterm=True))
+
+        default_handler = default._logger.handlers[0]
+        opted_in_handler = opted_in._logger.handlers[0]
+        assert default_handler is not opted_in_handler
+        assert default_handler not in buffered_file_handler._live_handlers
+        assert opted_in_handler in buffered_file_handler._live_handlers
+        default_handler.close()
+        opted_in_handler.close()
+
+    def test_unopened_handler_is_reusable(self, tmp_path: Path) -> None:
+        """Test that a delayed handler whose file does not exist yet is still reusable."""
+        handler = BufferedFileHandler(str(tmp_path / "delayed.log"), flush_interval=0, delay=True)
+
+        assert PythonLoggerAdapter._is_reusable(handler)
+        handler.close()
+
+    def test_repointing_logger_closes_and_evicts_previous_handlers(self, tmp_path: Path) -> None:
+        """Test that handlers detached by reconfiguration are closed and dropped from the registry."""
+        handlers = []
+        for index in range(20):
+            config = LoggerConfig(
+                name="shared_repoint", output_target=OutputTarget.FILE, directory=tmp_path, filename=f"{index}.log"
+            )
+            handlers.append(PythonLoggerAdapter(config)._logger.handlers[0])
+
+        registered = [
+            handler
+            for handler in PythonLoggerAdapter._shared_file_handlers.values()
+            if Path(handler.baseFilename).parent == tmp_path
+        ]
+        assert registered == [handlers[-1]]
+        assert all(handler.closed for handler in handlers[:-1])
+        handlers[-1].close()
+
+    def test_detached_handler_still_used_elsewhere_stays_open(self, tmp_path: Path) -> None:
+        """Test that a detached handler another logger still writes to is neither closed nor evicted."""
+        first = PythonLoggerAdapter(self._file_config("shared_detach_first", tmp_path))
+        PythonLoggerAdapter(self._file_config("shared_detach_second", tmp_path))
+        handler = first._logger.handlers[0]
+
+        PythonLoggerAdapter(LoggerConfig(name="shared_detach_first"))
+
+        assert not handler.closed
+        assert handler in PythonLoggerAdapter._shared_file_handlers.values()
+        handler.close()
+
+    def test_closing_queued_adapter_restores_direct_file_delivery(self, tmp_path: Path) -> None:
+        """Test that a closed queued adapter keeps writing straight to its file handler."""
+        adapter = PythonLoggerAdapter(self._file_config("shared_queued_close", tmp_path, use_queue=True))
+        handler = adapter._listener.handlers[0]  # type: ignore[union-attr]
+
+        adapter.close()
+        adapter.info("after close")
+        handler.flush()
+
+        assert adapter._logger.handlers == [handler]
+        assert "after close" in (tmp_path / "shared.log").read_text()
+
+    def test_closed_queued_adapter_file_handler_is_released_on_rebuild(self, tmp_path: Path) -> None:
+        """Test that the file handler of a closed queued adapter is closed once its logger is repointed."""
+        adapter = PythonLoggerAdapter(self._file_config("shared_queued_release", tmp_path, use_queue=True))
+        handler = adapter._listener.handlers[0]  # type: ignore[union-attr]
+        adapter.close()
+
+        PythonLoggerAdapter(self._file_config("shared_queued_release", tmp_path / "other"))
+
+        assert handler.closed  # type: ignore[attr-defined]
+        assert handler not in PythonLoggerAdapter._shared_file_handlers.values()
+
+    def test_release_file_handlers_only_closes_handlers_under_directory(self, tmp_path: Path) -> None:
+        """Test that release_file_handlers() closes and forgets only the handlers under the given directory."""
+        inside = PythonLoggerAdapter(self._file_config("shared_release_inside", tmp_path / "inside"))
+        outside = PythonLoggerAdapter(self._file_config("shared_release_outside", tmp_path / "outside"))
+        inside_handler = inside._logger.handlers[0]
+        outside_handler = outside._logger.handlers[0]
+
+        PythonLoggerAdapter.release_file_handlers(tmp_path / "inside")
+
+        assert inside_handler.closed  # type: ignore[attr-defined]
+        assert inside_handler not in PythonLoggerAdapter._shared_file_handlers.values()
+        assert not outside_handler.closed  # type: ignore[attr-defined]
+        PythonLoggerAdapter.release_file_handlers(tmp_path)
+        assert outside_handler.closed  # type: ignore[attr-defined]
+
+
+class TestPythonLoggerAdapterQueue:
+    """Test PythonLoggerAdapter with queued delivery enabled."""
+
+    def test_handlers_attached_directly_by_default(self) -> None:
+        """Test that without use_queue the real handler is attached and no listener runs."""
+        adapter = PythonLoggerAdapter(LoggerConfig(name="test_sync_unqueued"))
+
+        assert isinstance(adapter._logger.handlers[0], logging.StreamHandler)
+        assert adapter._listener is None
+
+    def test_use_queue_attaches_only_queue_handler(self) -> None:
+        """Test that use_queue moves the real handler behind a listener."""
+        adapter = PythonLoggerAdapter(LoggerConfig(name="test_sync_queued", use_queue=True))
+
+        assert len(adapter._logger.handlers) == 1
+        assert isinstance(adapter._logger.handlers[0], LocalQueueHandler)
+        assert adapter._listener is not None
+        assert isinstance(adapter._listener.handlers[0], logging.StreamHandler)
+        adapter.close()
+
+    def test_close_delivers_queued_records(self, tmp_path: Path) -> None:
+        """Test that close() writes queued records to the file."""
+        config = LoggerConfig(
+            name="test_sync_queued_file",
+            output_target=OutputTarget.FILE,
+            directory=tmp_path,
+            filename="queued.log",
+            use_queue=True,
+        )
+        adapter = PythonLoggerAdapter(config)
+
+        adapter.info("Queued %s", "record")
+        adapter.close()
+
+        assert "Queued record" in (tmp_path / "queued.log").read_text()
+        adapter._listener.handlers[0].close()  # type: ignore[union-attr]
+
+    def test_close_is_idempotent(self) -> None:
+        """Test that close() can be called repeatedly, with or without a queue."""
+        queued = PythonLoggerAdapter(LoggerConfig(name="test_sync_close_queued", use_queue=True))
+        unqueued = PythonLoggerAdapter(LoggerConfig(name="test_sync_close_unqueued"))
+
+        queued.close()
+        queued.close()
+        unqueued.close()
+        unqueued.close()
+
+    def test_queued_adapter_does_not_register_atexit_hook(self) -> None:
+        """Test that queued adapters rely on the module's single exit hook instead of registering their own."""
+        with patch("miraveja_log.infrastructure.adapters.python_logger_adapter.atexit.register") as register:
+            adapter = PythonLoggerAdapter(LoggerConfig(name="test_sync_queued_atexit", use_queue=True))
+
+        register.assert_not_called()
+        assert python_logger_adapter._queue_listeners["test_sync_queued_atexit"] is adapter._listener
+        adapter.close()
+
+    def test_close_unregisters_adapter(self) -> None:
+        """Test that a closed adapter's listener is dropped from the running listener registry."""
+        adapter = PythonLoggerAdapter(LoggerConfig(name="test_sync_queued_unregister", use_queue=True))
+
+        adapter.close()
+
+        assert "test_sync_queued_unregister" not in python_logger_adapter._queue_listeners
+
+    def test_rebuilding_queued_logger_stops_previous_listener(self) -> None:
+        """Test that reconfiguring a logger stops the listener of the adapter it replaces."""
+        first = PythonLoggerAdapter(LoggerConfig(name="test_sync_queued_rebuild", use_queue=True))
+        second = PythonLoggerAdapter(LoggerConfig(name="test_sync_queued_rebuild", use_queue=True))
+
+        assert first._listener._thread is None  # type: ignore[union-attr]
+        assert second._listener._thread is not None  # type: ignore[union-attr]
+        assert python_logger_adapter._queue_listeners["test_sync_queued_rebuild"] is second._listener
+        first.close()
+        second.close()
+
+    def test_rebuilding_without_queue_stops_previous_listener(self) -> None:
+        """Test that rebuilding a queued logger as an unqueued one also stops the old listener."""
+        queued = PythonLoggerAdapter(LoggerConfig(name="test_sync_queued_unqueue", use_queue=True))
+        PythonLoggerAdapter(LoggerConfig(name="test_sync_queued_unqueue"))
+
+        assert queued._listener._thread is None  # type: ignore[union-attr]
+        assert "test_sync_queued_unqueue" not in python_logger_adapter._queue_listeners
+
+    def test_exit_hook_stops_running_listeners(self) -> None:
+        """Test that the module exit hook stops every running queue listener."""
+        adapter = PythonLoggerAdapter(LoggerConfig(name="test_sync_queued_exit_hook", use_queue=True))
+
+        python_logger_adapter._stop_queue_listeners()
+
+        assert adapter._listener._thread is None  # type: ignore[union-attr]
+        assert "test_sync_queued_exit_hook" not in python_logger_adapter._queue_listeners
+        adapter.close()
+
+    def test_rebuilding_stops_listener_of_discarded_adapter(self) -> None:
+        """Test that a listener is still stopped on rebuild when nothing references its adapter anymore."""
+        listener = PythonLoggerAdapter(LoggerConfig(name="test_sync_queued_discarded", use_queue=True))._listener
+        rebuilt = PythonLoggerAdapter(LoggerConfig(name="test_sync_queued_discarded", use_queue=True))
+
+        assert listener._thread is None  # type: ignore[union-attr]
+        rebuilt.close()
+
+
 class TestPythonLoggerAdapterJSONOutput:
     """Test PythonLoggerAdapter with JSON output."""
 
@@ -243,6 +560,31 @@ class TestPythonLoggerAdapterLoggingMethods:
             mock_critical.assert_called_once_with("Critical message")
 
 
+class TestPythonLoggerAdapterLevelGate:
+    """Test that disabled levels return before calling into logging.Logger."""
+
+    def test_disabled_level_does_not_call_logger(self) -> None:
+        """Test that a debug call on an INFO adapter never reaches the logger method."""
+        adapter = PythonLoggerAdapter(LoggerConfig(name="test_sync_level_gate", level=LogLevel.INFO))
+
+        with patch.object(adapter._logger, "debug") as mock_debug, patch.object(adapter._logger, "info") as mock_info:
+            adapter.debug("Filtered message")
+            adapter.info("Delivered message")
+
+        mock_debug.assert_not_called()
+        mock_info.assert_called_once_with("Delivered message")
+
+    def test_gate_follows_runtime_level_changes(self) -> None:
+        """Test that changing the logger level after construction is honoured."""
+        adapter = PythonLoggerAdapter(LoggerConfig(name="test_sync_level_gate_runtime", level=LogLevel.INFO))
+        adapter._logger.setLevel(logging.DEBUG)
+
+        with patch.object(adapter._logger, "debug") as mock_debug:
+            adapter.debug("Now enabled")
+
+        mock_debug.assert_called_once_with("Now enabled")
+
+
 class TestPythonLoggerAdapterLoggingWithArgs:
     """Test PythonLoggerAdapter logging methods with args and kwargs."""
 
@@ -289,6 +631,34 @@ class TestPythonLoggerAdapterHandlerMapping:
         assert OutputTarget.FILE in PythonLoggerAdapter.FORMATTER_TARGET_MAPPER
         assert OutputTarget.JSON in PythonLoggerAdapter.FORMATTER_TARGET_MAPPER
 
+    def test_text_formatter_is_reused_for_same_settings(self) -> None:
+        """Test that console loggers rebuilt with the same settings share one text formatter."""
+        first = PythonLoggerAdapter(LoggerConfig(name="cached_text_formatter"))
+        first_formatter = first._logger.handlers[0].formatter
+
+        second = PythonLoggerAdapter(LoggerConfig(name="cached_text_formatter"))
+
+        assert second._logger.handlers[0].formatter is first_formatter
+
+    def test_text_formatter_differs_per_logger_name(self) -> None:
+        """Test that text formatters are not shared across logger names, which they specialize on."""
+        first = PythonLoggerAdapter(LoggerConfig(name="cached_text_formatter_a"))
+        second = PythonLoggerAdapter(LoggerConfig(name="cached_text_formatter_b"))
+
+        assert first._logger.handlers[0].formatter is not second._logger.handlers[0].formatter
+
+    def test_json_formatter_is_shared_across_logger_names(self) -> None:
+        """Test that JSON formatters with the same settings are shared between loggers."""
+        config = LoggerConfig(
+            name="cached_json_formatter", output_target=OutputTarget.JSON, directory="logs", filename="x.json"
+        )
+
+        formatter = PythonLoggerAdapter.FORMATTER_TARGET_MAPPER[OutputTarget.JSON](config)
+
+        assert formatter is PythonLoggerAdapter.FORMATTER_TARGET_MAPPER[OutputTarget.JSON](
+            dataclasses.replace(config, name="cached_json_formatter_other")
+        )
+
 
 class TestPythonLoggerAdapterExceptionHandling:
     """Test exception handling in PythonLoggerAdapter."""
@@ -318,6 +688,30 @@ class TestPythonLoggerAdapterExceptionHandling:
             assert "output_target" in str(exc_info.value)
             assert "Unsupported output target" in str(exc_info.value)
 
+    def test_unsupported_formatter_target_does_not_create_handler(self) -> None:
+        """Test that the handler factory is not called when the formatter target is unsupported."""
+        config = LoggerConfig(name="test_logger_unsupported_formatter")
+        handler_factory = MagicMock()
+
+        with patch.object(PythonLoggerAdapter, "HANDLER_TARGET_MAPPER", {OutputTarget.CONSOLE: handler_factory}):
+            with patch.object(PythonLoggerAdapter, "FORMATTER_TARGET_MAPPER", {}):
+                with pytest.raises(ConfigurationException):
+                    PythonLoggerAdapter(config)
+
+        handler_factory.assert_not_called()
+
+    def test_unsupported_target_keeps_existing_logger_handlers(self) -> None:
+        """Test that a failed reconfiguration leaves the existing logger untouched."""
+        config = LoggerConfig(name="test_logger_failed_reconfigure")
+        adapter = PythonLoggerAdapter(config)
+        existing_handlers = list(adapter._logger.handlers)
+
+        with patch.object(PythonLoggerAdapter, "HANDLER_TARGET_MAPPER", {}):
+            with pytest.raises(ConfigurationException):
+                PythonLoggerAdapter(config)
+
+        assert adapter._logger.handlers == existing_handlers
+
 
 class TestPythonLoggerAdapterEdgeCases:
     """Test edge cases and special scenarios."""
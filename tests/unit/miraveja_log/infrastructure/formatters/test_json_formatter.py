@@ -2,13 +2,24 @@
 
 import json
 import logging
+import sys
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
 from miraveja_log.infrastructure.formatters.json_formatter import JSONFormatter
 
 
+def _make_record(
+    msg: object = "hello", args: tuple = (), name: str = "test_logger", **extra: object
+) -> logging.LogRecord:
+    """Build an INFO record, optionally carrying extra attributes."""
+    record = logging.LogRecord(name, logging.INFO, "test.py", 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
 class TestJSONFormatterBasics:
     """Test basic JSONFormatter functionality."""
 
@@ -193,8 +204,6 @@ class TestJSONFormatterExceptionHandling:
         try:
             raise ValueError("Test exception")
         except ValueError:
-            import sys
-
             exc_info = sys.exc_info()
             record = logging.LogRecord(
                 name="test_logger",
@@ -405,3 +414,258 @@ class TestJSONFormatterEdgeCases:
         # Should be able to parse as ISO format
         timestamp = datetime.fromisoformat(json_data["timestamp"])
         assert isinstance(timestamp, datetime)
+
+
+class TestJSONFormatterTimestamp:
+    """Test JSONFormatter.format_timestamp() method."""
+
+    @pytest.mark.parametrize(
+        "created",
+        [1718461845.0, 1718461845.123456, 1718461845.5, 1718461845.9999996, 1718461845.0000004, 1.5e9 + 0.25],
+    )
+    def test_format_timestamp_matches_datetime_isoformat(self, created: float) -> None:
+        """Test that cached timestamps match datetime.fromtimestamp().isoformat()."""
+        formatter = JSONFormatter()
+
+        assert formatter.format_timestamp(created) == datetime.fromtimestamp(created).isoformat()
+
+    def test_format_timestamp_reuses_prefix_within_same_second(self) -> None:
+        """Test that the date and time prefix is rendered once per second."""
+        formatter = JSONFormatter()
+
+        formatter.format_timestamp(1718461845.1)
+        cached = formatter._second_cache
+        formatter.format_timestamp(1718461845.2)
+
+        assert formatter._second_cache is cached
+
+    def test_format_timestamp_refreshes_prefix_on_new_second(self) -> None:
+        """Test that a record in a later second renders a new prefix."""
+        formatter = JSONFormatter()
+
+        first = formatter.format_timestamp(1718461845.1)
+        second = formatter.format_timestamp(1718461846.1)
+
+        assert first != second
+        assert second == datetime.fromtimestamp(1718461846.1).isoformat()
+
+
+class TestJSONFormatterSerialize:
+    """Test JSONFormatter.serialize() method."""
+
+    def test_serialize_round_trips_nested_values(self) -> None:
+        """Test that serialized output decodes back to the original data."""
+        data = {"message": "hello", "nested": {"list": [1, 2.5, None, True]}, "unicode": "olá"}
+
+        assert json.loads(JSONFormatter.serialize(data)) == data
+
+    def test_serialize_accepts_non_string_nested_keys(self) -> None:
+        """Test that nested dictionaries with non-string keys are serialized like the json module."""
+        data = {"counts": {1: "one"}}
+
+        assert json.loads(JSONFormatter.serialize(data)) == {"counts": {"1": "one"}}
+
+    def test_serialize_falls_back_for_values_orjson_rejects(self) -> None:
+        """Test that integers wider than 64 bits are still serialized."""
+        data = {"big": 2**70}
+
+        assert json.loads(JSONFormatter.serialize(data)) == data
+
+    def test_serialize_without_orjson_uses_json_module(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the standard library encoder is used when orjson is unavailable."""
+        monkeypatch.setattr("miraveja_log.infrastructure.formatters.json_formatter.orjson", None)
+        data = {"message": "hello"}
+
+        assert JSONFormatter.serialize(data) == json.dumps(data, separators=(",", ":"))
+
+    def test_serialize_output_does_not_depend_on_encoder(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that orjson and the json module produce identical text for plain JSON values."""
+        data = {"message": "olá", "nested": {"list": [1, 2.5, None, True], 1: "one"}}
+        with_orjson = JSONFormatter.serialize(data)
+
+        monkeypatch.setattr("miraveja_log.infrastructure.formatters.json_formatter.orjson", None)
+
+        assert JSONFormatter.serialize(data) == with_orjson
+
+    def test_serialize_escapes_non_ascii_characters(self) -> None:
+        """Test that non-ASCII characters are escaped like the json module does, whichever encoder runs."""
+        data = {"message": "olá \u2028 \U0001f600", "nested": {"módulo": ["ção"]}}
+
+        result = JSONFormatter.serialize(data)
+
+        assert result.isascii()
+        assert "\\u00e1" in result and "\\ud83d\\ude00" in result
+        assert json.loads(result) == data
+
+    def test_serialize_escapes_delete_character_like_json_module(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that DEL, which is ASCII but escaped by the json module, is escaped by orjson as well."""
+        data = {"message": "a\x7fb", "name": "olá\x7f"}
+        with_orjson = JSONFormatter.serialize(data)
+
+        monkeypatch.setattr("miraveja_log.infrastructure.formatters.json_formatter.orjson", None)
+
+        assert with_orjson == JSONFormatter.serialize(data)
+        assert '"a\\u007fb"' in with_orjson
+
+    def test_serialize_raises_type_error_for_unserializable_values(self) -> None:
+        """Test that unserializable values still raise TypeError."""
+        with pytest.raises(TypeError):
+            JSONFormatter.serialize({"value": object()})
+
+
+class TestJSONFormatterFastPath:
+    """Test the per-record shortcuts taken by JSONFormatter.format()."""
+
+    def test_message_without_args_is_used_verbatim(self) -> None:
+        """Test that a string message without args is emitted as-is."""
+        record = _make_record("100% done")
+
+        assert json.loads(JSONFormatter().format(record))["message"] == "100% done"
+
+    def test_message_with_args_is_interpolated(self) -> None:
+        """Test that message arguments are still merged."""
+        record = _make_record("user %s", ("alice",))
+
+        assert json.loads(JSONFormatter().format(record))["message"] == "user alice"
+
+    def test_non_string_message_is_converted(self) -> None:
+        """Test that non-string messages are converted with str()."""
+        record = _make_record(ValueError("boom"))
+
+        assert json.loads(JSONFormatter().format(record))["message"] == "boom"
+
+    def test_reserved_attrs_is_shared_frozenset(self) -> None:
+        """Test that reserved attributes are a class-level frozenset."""
+        assert isinstance(JSONFormatter.RESERVED_ATTRS, frozenset)
+        assert "msg" in JSONFormatter.RESERVED_ATTRS
+
+    def test_exception_text_is_cached_on_record(self) -> None:
+        """Test that the formatted traceback is cached in record.exc_text."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord("test_logger", logging.ERROR, "test.py", 1, "failed", (), sys.exc_info())
+
+        formatter = JSONFormatter()
+        first = json.loads(formatter.format(record))
+
+        assert record.exc_text == first["exception"]
+        assert "ValueError: boom" in record.exc_text
+
+
+class TestJSONFormatterExtraKeysCache:
+    """Test caching of extra field names per record layout."""
+
+    def test_records_with_same_layout_share_cache_entry(self) -> None:
+        """Test that records with the same extras reuse one cached entry."""
+        formatter = JSONFormatter()
+
+        first = json.loads(formatter.format(_make_record(user_id="1", action="login")))
+        second = json.loads(formatter.format(_make_record(user_id="2", action="logout")))
+
+        assert len(formatter._extra_keys_cache) == 1
+        assert (first["user_id"], first["action"]) == ("1", "login")
+        assert (second["user_id"], second["action"]) == ("2", "logout")
+
+    def test_records_with_different_extras_get_own_fields(self) -> None:
+        """Test that a different layout does not reuse another layout's fields."""
+        formatter = JSONFormatter()
+
+        formatter.format(_make_record(user_id="1"))
+        result = json.loads(formatter.format(_make_record(order_id="9")))
+
+        assert result["order_id"] == "9"
+        assert "user_id" not in result
+
+    def test_private_attributes_are_not_emitted(self) -> None:
+        """Test that underscore-prefixed attributes are skipped."""
+        result = json.loads(JSONFormatter().format(_make_record(_internal="x", visible="y")))
+
+        assert "_internal" not in result
+        assert result["visible"] == "y"
+
+    def test_attributes_added_by_text_formatter_are_not_emitted(self) -> None:
+        """Test that a record already formatted by a text formatter does not leak asctime/message."""
+        record = _make_record(user_id="1")
+        logging.Formatter("%(asctime)s %(message)s").format(record)
+
+        result = json.loads(JSONFormatter().format(record))
+
+        assert "asctime" not in result
+        assert result["user_id"] == "1"
+
+    def test_cache_size_is_bounded(self) -> None:
+        """Test that the cache stops growing at EXTRA_KEYS_CACHE_SIZE layouts."""
+        formatter = JSONFormatter()
+
+        for index in range(JSONFormatter.EXTRA_KEYS_CACHE_SIZE + 10):
+            result = json.loads(formatter.format(_make_record(**{f"field_{index}": index})))
+            assert result[f"field_{index}"] == index
+
+        assert len(formatter._extra_keys_cache) == JSONFormatter.EXTRA_KEYS_CACHE_SIZE
+
+
+class TestJSONFormatterFixedFields:
+    """Test the dictionary-free output for records without extras or exception."""
+
+    @pytest.mark.parametrize("with_orjson", [True, False])
+    @pytest.mark.parametrize("message", ['say "hi"\\n\tnow', "olá \u2028 \U0001f600", "a\x7fb"])
+    def test_output_matches_serialize(self, monkeypatch: pytest.MonkeyPatch, with_orjson: bool, message: str) -> None:
+        """Test that the joined output is identical to serializing the equivalent dictionary."""
+        if not with_orjson:
+            monkeypatch.setattr("miraveja_log.infrastructure.formatters.json_formatter.orjson", None)
+        formatter = JSONFormatter()
+        record = _make_record(message, name="módulo")
+
+        expected = JSONFormatter.serialize(
+            {
+                "timestamp": formatter.format_timestamp(record.created),
+                "level": "INFO",
+                "name": "módulo",
+                "message": message,
+            }
+        )
+
+        assert formatter.format(record) == expected
+
+    def test_plain_record_skips_serialize(self) -> None:
+        """Test that records without extras or exception never reach serialize()."""
+        with patch.object(JSONFormatter, "serialize") as mock_serialize:
+            JSONFormatter().format(_make_record())
+
+        mock_serialize.assert_not_called()
+
+    def test_non_ascii_and_control_characters_round_trip(self) -> None:
+        """Test that escaped values decode back to the original strings."""
+        message = "olá \u2028 \x00 \U0001f600 \ud800"
+
+        result = json.loads(JSONFormatter().format(_make_record(message, name="módulo")))
+
+        assert result["message"] == message
+        assert result["name"] == "módulo"
+
+    def test_non_string_logger_name_falls_back_to_encoder(self) -> None:
+        """Test that a non-string logger name is still serialized."""
+        record = _make_record()
+        record.name = 42  # type: ignore[assignment]
+
+        assert json.loads(JSONFormatter().format(record))["name"] == 42
+
+    def test_level_and_name_section_is_cached(self) -> None:
+        """Test that records from the same logger and level reuse the escaped section."""
+        formatter = JSONFormatter()
+
+        first = json.loads(formatter.format(_make_record("first")))
+        second = json.loads(formatter.format(_make_record("second")))
+
+        assert len(formatter._fixed_fields_cache) == 1
+        assert (first["message"], second["message"]) == ("first", "second")
+
+    def test_fixed_fields_cache_size_is_bounded(self) -> None:
+        """Test that the cache stops growing at FIXED_FIELDS_CACHE_SIZE entries."""
+        formatter = JSONFormatter()
+
+        for index in range(JSONFormatter.FIXED_FIELDS_CACHE_SIZE + 10):
+            assert json.loads(formatter.format(_make_record(name=f"app{index}")))["name"] == f"app{index}"
+
+        assert len(formatter._fixed_fields_cache) == JSONFormatter.FIXED_FIELDS_CACHE_SIZE
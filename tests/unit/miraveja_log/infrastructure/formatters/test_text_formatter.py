@@ -0,0 +1,180 @@
+"""Unit tests for text formatter."""
+
+import logging
+
+import pytest
+
+from miraveja_log.infrastructure.formatters.text_formatter import TextFormatter
+
+
+def _make_record(name: str, msg: str = "hello", args: tuple = ()) -> logging.LogRecord:
+    """Build a log record for the given logger name."""
+    return logging.LogRecord(name, logging.INFO, __file__, 1, msg, args, None)
+
+
+class TestTextFormatterBasics:
+    """Test basic TextFormatter functionality."""
+
+    def test_text_formatter_inherits_from_logging_formatter(self) -> None:
+        """Test that TextFormatter inherits from logging.Formatter."""
+        assert isinstance(TextFormatter(), logging.Formatter)
+
+    def test_format_without_logger_name_matches_standard_formatter(self) -> None:
+        """Test that TextFormatter without a logger name behaves like logging.Formatter."""
+        fmt = "%(name)s - %(levelname)s - %(message)s"
+        record = _make_record("app")
+
+        assert TextFormatter(fmt).format(record) == logging.Formatter(fmt).format(record)
+
+    def test_uses_time_matches_standard_formatter(self) -> None:
+        """Test that the precomputed usesTime() agrees with logging.Formatter."""
+        for fmt in (None, "%(asctime)s - %(message)s", "%(levelname)s | %(message)s"):
+            assert TextFormatter(fmt).usesTime() == logging.Formatter(fmt).usesTime()
+
+    def test_format_without_asctime_skips_format_time(self) -> None:
+        """Test that a format without asctime never renders the creation time."""
+        formatter = TextFormatter("%(levelname)s | %(message)s")
+        record = _make_record("app")
+
+        assert formatter.format(record) == "INFO | hello"
+        assert not hasattr(record, "asctime")
+        assert formatter._time_cache == (-1, None, "")
+
+
+class TestTextFormatterSpecialization:
+    """Test the name-specialized format string."""
+
+    def test_specialized_output_matches_generic_output(self) -> None:
+        """Test that baking the logger name does not change the formatted output."""
+        fmt = "%(name)s - %(levelname)s - %(message)s"
+        record = _make_record("app", "value=%d", (42,))
+
+        assert TextFormatter(fmt, logger_name="app").format(record) == "app - INFO - value=42"
+
+    def test_specialized_style_bakes_logger_name(self) -> None:
+        """Test that the specialized format string contains the literal logger name."""
+        formatter = TextFormatter("%(name)s: %(message)s", logger_name="app")
+
+        assert formatter._specialized_style is not None
+        assert formatter._specialized_style._fmt == "app: %(message)s"
+
+    def test_logger_name_with_percent_is_escaped(self) -> None:
+        """Test that a '%' in the logger name is emitted literally."""
+        formatter = TextFormatter("%(name)s: %(message)s", logger_name="100%(s)")
+
+        assert formatter.format(_make_record("100%(s)")) == "100%(s): hello"
+
+    def test_records_from_other_loggers_use_generic_format(self) -> None:
+        """Test that records propagated from child loggers keep their own name."""
+        formatter = TextFormatter("%(name)s: %(message)s", logger_name="app")
+
+        assert formatter.format(_make_record("app.child")) == "app.child: hello"
+
+    def test_format_without_name_placeholder_is_not_specialized(self) -> None:
+        """Test that no specialized style is built when the format has no name placeholder."""
+        formatter = TextFormatter("%(levelname)s: %(message)s", logger_name="app")
+
+        assert formatter._specialized_style is None
+        assert formatter.format(_make_record("app")) == "INFO: hello"
+
+    def test_format_with_only_name_placeholder(self) -> None:
+        """Test that a format consisting solely of the name placeholder still formats."""
+        formatter = TextFormatter("%(name)s", logger_name="app")
+
+        assert formatter.format(_make_record("app")) == "app"
+
+
+class TestTextFormatterCompiledFormat:
+    """Test the positional format compiled from the %-style format string."""
+
+    def test_compiled_output_matches_standard_formatter(self) -> None:
+        """Test that compiled formats render exactly like logging.Formatter."""
+        record = _make_record("app", "value=%d", (42,))
+        for fmt in (
+            "%(levelname)s | %(message)s",
+            "%(message)s",
+            "100%% %(levelname)-8s|%(lineno)5d|%(message)r",
+            "%(name)s - %(levelname)s - %(message)s",
+        ):
+            formatter = TextFormatter(fmt)
+
+            assert formatter._compiled_format is not None
+            assert formatter.format(record) == logging.Formatter(fmt).format(record)
+
+    def test_compiled_format_rewrites_named_fields(self) -> None:
+        """Test that named conversions become positional ones, keeping literal '%%'."""
+        formatter = TextFormatter("%%%(levelname)-8s %(message)s")
+
+        assert formatter._compiled_format is not None
+        assert formatter._compiled_format[0] == "%%%-8s %s"
+
+    def test_specialized_format_is_compiled(self) -> None:
+        """Test that the name-specialized format is compiled as well."""
+        formatter = TextFormatter("%(name)s: %(message)s", logger_name="app")
+
+        assert formatter._compiled_specialized_format is not None
+        assert formatter._compiled_specialized_format[0] == "app: %s"
+        assert formatter.format(_make_record("app")) == "app: hello"
+
+    def test_formats_without_named_fields_are_not_compiled(self) -> None:
+        """Test that formats the rewrite cannot express keep using PercentStyle."""
+        for fmt in ("static text", "%(message)*s"):
+            assert TextFormatter._compile_format(fmt) is None
+
+    def test_missing_field_raises_like_standard_formatter(self) -> None:
+        """Test that a field absent from the record raises logging.Formatter's ValueError."""
+        formatter = TextFormatter("%(user_id)s %(message)s")
+
+        with pytest.raises(ValueError, match="Formatting field not found in record"):
+            formatter.format(_make_record("app"))
+
+
+class TestTextFormatterFormatTime:
+    """Test the per-second cache used by TextFormatter.formatTime()."""
+
+    @staticmethod
+    def _record_at(created: float) -> logging.LogRecord:
+        """Build a record created at the given timestamp."""
+        record = _make_record("app")
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        return record
+
+    def test_format_time_matches_standard_formatter(self) -> None:
+        """Test that cached times match logging.Formatter for default and custom date formats."""
+        for datefmt in (None, "%Y-%m-%d %H:%M:%S", "%H:%M"):
+            for created in (1718461845.0, 1718461845.25, 1718461845.999, 1718461846.5):
+                record = self._record_at(created)
+                expected = logging.Formatter(datefmt=datefmt).formatTime(record, datefmt)
+
+                assert TextFormatter(date_format=datefmt).formatTime(record, datefmt) == expected
+
+    def test_same_second_reuses_rendered_time(self) -> None:
+        """Test that records within one second reuse the cached text."""
+        formatter = TextFormatter(date_format="%Y-%m-%d %H:%M:%S")
+
+        formatter.formatTime(self._record_at(1718461845.1), formatter.datefmt)
+        cached = formatter._time_cache
+        formatter.formatTime(self._record_at(1718461845.9), formatter.datefmt)
+
+        assert formatter._time_cache is cached
+
+    def test_default_format_keeps_milliseconds(self) -> None:
+        """Test that the default format still varies by millisecond within a second."""
+        formatter = TextFormatter()
+
+        first_record = self._record_at(1718461845.1)
+        second_record = self._record_at(1718461845.2)
+        first_record.msecs, second_record.msecs = 100.0, 200.0
+
+        assert formatter.formatTime(first_record).endswith(",100")
+        assert formatter.formatTime(second_record).endswith(",200")
+
+    def test_changing_date_format_refreshes_cache(self) -> None:
+        """Test that a different date format within the same second is rendered anew."""
+        formatter = TextFormatter()
+        record = self._record_at(1718461845.1)
+
+        formatter.formatTime(record, "%Y")
+
+        assert formatter.formatTime(record, "%H:%M:%S") == logging.Formatter().formatTime(record, "%H:%M:%S")
@@ -0,0 +1 @@
+"""Handler unit tests."""
@@ -0,0 +1,143 @@
+"""Unit tests for BatchingQueueListener."""
+
+import logging
+import queue
+from logging.handlers import QueueListener
+
+from miraveja_log.infrastructure.handlers.batching_queue_listener import BatchingQueueListener
+
+
+class RecordingHandler(logging.Handler):
+    """Handler that records emitted messages and flush calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+        self.flushes: int = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+def _make_record(message: str) -> logging.LogRecord:
+    """Build an INFO record with the given message."""
+    return logging.LogRecord("test", logging.INFO, "test.py", 1, message, (), None)
+
+
+class TestBatchingQueueListener:
+    """Test BatchingQueueListener batching behaviour."""
+
+    def test_batching_queue_listener_is_a_queue_listener(self) -> None:
+        """Test that BatchingQueueListener extends the stdlib QueueListener."""
+        listener = BatchingQueueListener(queue.SimpleQueue(), RecordingHandler())
+        assert isinstance(listener, QueueListener)
+
+    def test_listener_delivers_all_records_in_order(self) -> None:
+        """Test that every queued record reaches the handler in order."""
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        handler = RecordingHandler()
+        listener = BatchingQueueListener(log_queue, handler)
+
+        for i in range(20):
+            log_queue.put_nowait(_make_record(f"Message {i}"))
+        listener.start()
+        listener.stop()
+
+        assert handler.messages == [f"Message {i}" for i in range(20)]
+
+    def test_listener_flushes_once_per_burst(self) -> None:
+        """Test that records queued together share a single flush."""
+        log_queue: queue.Queue = queue.Queue()
+        handler = RecordingHandler()
+        listener = BatchingQueueListener(log_queue, handler, batch_size=100)
+
+        for i in range(50):
+            log_queue.put_nowait(_make_record(f"Message {i}"))
+        listener.start()
+        log_queue.join()
+
+        assert len(handler.messages) == 50
+        assert handler.flushes == 1
+        listener.stop()
+
+    def test_single_record_is_left_to_handler_flush_policy(self) -> None:
+        """Test that a record arriving on its own does not trigger a flush."""
+        log_queue: queue.Queue = queue.Queue()
+        handler = RecordingHandler()
+        listener = BatchingQueueListener(log_queue, handler)
+        listener.start()
+
+        for i in range(3):
+            log_queue.put_nowait(_make_record(f"Message {i}"))
+            log_queue.join()
+
+        assert len(handler.messages) == 3
+        assert handler.flushes == 0
+        listener.stop()
+
+    def test_listener_respects_batch_size(self) -> None:
+        """Test that long bursts are flushed every batch_size records."""
+        log_queue: queue.Queue = queue.Queue()
+        handler = RecordingHandler()
+        listener = BatchingQueueListener(log_queue, handler, batch_size=10)
+
+        for i in range(25):
+            log_queue.put_nowait(_make_record(f"Message {i}"))
+        listener.start()
+        log_queue.join()
+
+        assert len(handler.messages) == 25
+        assert handler.flushes == 3
+        listener.stop()
+
+    def test_stop_flushes_handlers(self) -> None:
+        """Test that stopping the listener flushes whatever the handlers still buffer."""
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        handler = RecordingHandler()
+        listener = BatchingQueueListener(log_queue, handler)
+        listener.start()
+
+        log_queue.put_nowait(_make_record("Last"))
+        listener.stop()
+
+        assert handler.messages == ["Last"]
+        assert handler.flushes >= 1
+
+    def test_listener_marks_tasks_done_for_joinable_queues(self) -> None:
+        """Test that queue.Queue.join() returns once records are handled."""
+        log_queue: queue.Queue = queue.Queue()
+        handler = RecordingHandler()
+        listener = BatchingQueueListener(log_queue, handler)
+        listener.start()
+
+        log_queue.put_nowait(_make_record("Joined"))
+        log_queue.join()
+
+        assert handler.messages == ["Joined"]
+        listener.stop()
+
+    def test_stop_is_idempotent(self) -> None:
+        """Test that stopping a listener twice, or one that never started, does nothing."""
+        never_started = BatchingQueueListener(queue.SimpleQueue(), RecordingHandler())
+        listener = BatchingQueueListener(queue.SimpleQueue(), RecordingHandler())
+        listener.start()
+
+        never_started.stop()
+        listener.stop()
+        listener.stop()
+
+    def test_flush_handlers_ignores_closed_streams(self) -> None:
+        """Test that flushing a handler with a closed stream does not raise."""
+
+        class ClosedStreamHandler(RecordingHandler):
+            """Handler whose stream has already been closed."""
+
+            def flush(self) -> None:
+                raise ValueError("I/O operation on closed file.")
+
+        listener = BatchingQueueListener(queue.SimpleQueue(), ClosedStreamHandler())
+
+        listener.flush_handlers()
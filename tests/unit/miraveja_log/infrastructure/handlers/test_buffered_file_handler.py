@@ -0,0 +1,245 @@
+"""Unit tests for BufferedFileHandler."""
+
+import io
+import logging
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from miraveja_log.infrastructure.handlers import buffered_file_handler
+from miraveja_log.infrastructure.handlers.buffered_file_handler import BufferedFileHandler
+
+
+def _make_record(message: str, level: int = logging.INFO) -> logging.LogRecord:
+    """Build a record with the given message and level."""
+    return logging.LogRecord("test", level, "test.py", 1, message, (), None)
+
+
+class TestBufferedFileHandler:
+    """Test BufferedFileHandler buffering behaviour."""
+
+    def test_buffered_file_handler_is_a_file_handler(self, tmp_path: Path) -> None:
+        """Test that BufferedFileHandler is a logging.FileHandler."""
+        handler = BufferedFileHandler(str(tmp_path / "app.log"), flush_interval=0)
+
+        assert isinstance(handler, logging.FileHandler)
+        handler.close()
+
+    def test_records_below_flush_level_stay_buffered(self, tmp_path: Path) -> None:
+        """Test that INFO records are not written until flushed."""
+        log_path = tmp_path / "app.log"
+        handler = BufferedFileHandler(str(log_path), flush_interval=0)
+
+        handler.emit(_make_record("Buffered message"))
+        assert log_path.read_text() == ""
+
+        handler.flush()
+        assert "Buffered message" in log_path.read_text()
+        handler.close()
+
+    def test_records_at_flush_level_are_written_immediately(self, tmp_path: Path) -> None:
+        """Test that ERROR records flush the buffer."""
+        log_path = tmp_path / "app.log"
+        handler = BufferedFileHandler(str(log_path), flush_interval=0)
+
+        handler.emit(_make_record("Buffered message"))
+        handler.emit(_make_record("Error message", logging.ERROR))
+
+        content = log_path.read_text()
+        assert "Buffered message" in content
+        assert "Error message" in content
+        handler.close()
+
+    def test_close_writes_buffered_records(self, tmp_path: Path) -> None:
+        """Test that closing the handler writes pending records."""
+        log_path = tmp_path / "app.log"
+        handler = BufferedFileHandler(str(log_path), flush_interval=0)
+
+        handler.emit(_make_record("Pending message"))
+        handler.close()
+
+        assert "Pending message" in log_path.read_text()
+
+    def test_background_flusher_bounds_latency(self, tmp_path: Path) -> None:
+        """Test that the background thread flushes buffered records periodically."""
+        log_path = tmp_path / "app.log"
+        handler = BufferedFileHandler(str(log_path), flush_interval=0.01)
+
+        handler.emit(_make_record("Periodic message"))
+
+        deadline = time.monotonic() + 2
+        while "Periodic message" not in log_path.read_text() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert "Periodic message" in log_path.read_text()
+        handler.close()
+
+    def test_no_flusher_thread_when_interval_is_zero(self, tmp_path: Path) -> None:
+        """Test that a zero interval disables the background flusher."""
+        handler = BufferedFileHandler(str(tmp_path / "app.log"), flush_interval=0)
+
+        assert handler._flusher is None
+        handler.close()
+
+    def test_stream_uses_configured_buffer_capacity(self, tmp_path: Path) -> None:
+        """Test that the file is opened with the configured buffer size."""
+        handler = BufferedFileHandler(str(tmp_path / "app.log"), buffer_capacity=4096, flush_interval=0)
+
+        assert isinstance(handler.stream.buffer, io.BufferedWriter)
+        assert handler.buffer_capacity == 4096
+        handler.close()
+
+    def test_buffer_capacity_of_one_writes_each_record_through(self, tmp_path: Path) -> None:
+        """Test that a buffer capacity of 1 selects line buffering, so records need no flush."""
+        log_path = tmp_path / "app.log"
+        handler = BufferedFileHandler(str(log_path), buffer_capacity=1, flush_interval=0)
+
+        handler.emit(_make_record("written through"))
+
+        assert handler.stream.line_buffering
+        assert log_path.read_text() == "written through\n"
+        handler.close()
+
+    def test_closed_reflects_close(self, tmp_path: Path) -> None:
+        """Test that the closed property is set once the handler is closed."""
+        handler = BufferedFileHandler(str(tmp_path / "app.log"), flush_interval=0)
+
+        assert handler.closed is False
+        handler.close()
+        assert handler.closed is True
+
+    def test_delay_defers_file_creation_until_first_record(self, tmp_path: Path) -> None:
+        """Test that a delayed handler creates its file only when a record is written."""
+        log_path = tmp_path / "app.log"
+        handler = BufferedFileHandler(str(log_path), flush_interval=0, delay=True)
+
+        assert not log_path.exists()
+        handler.emit(_make_record("First message"))
+        handler.flush()
+
+        assert "First message" in log_path.read_text()
+        handler.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="SIGTERM cannot be caught on Windows")
+class TestBufferedFileHandlerSigterm:
+    """Test flushing of buffered records when the process receives SIGTERM."""
+
+    def test_sigterm_flushes_buffered_records(self, tmp_path: Path) -> None:
+        """Test that buffered records reach the file and the process still dies from SIGTERM."""
+        log_path = tmp_path / "app.log"
+        script = (
+            "import logging, os, signal\n"
+            "from miraveja_log.infrastructure.handlers import BufferedFileHandler\n"
+            f"handler = BufferedFileHandler({str(log_path)!r}, flush_interval=0, flush_on_sigterm=True)\n"
+            "handler.emit(logging.LogRecord('test', logging.INFO, 'test.py', 1, 'Before SIGTERM', (), None))\n"
+            "os.kill(os.getpid(), signal.SIGTERM)\n"
+        )
+
+        result = subprocess.run([sys.executable, "-c", script], check=False)
+
+        assert result.returncode == -signal.SIGTERM
+        assert "Before SIGTERM" in log_path.read_text()
+
+    def test_existing_sigterm_handler_is_not_replaced(self, tmp_path: Path) -> None:
+        """Test that an application's own SIGTERM handler is left in place."""
+        script = (
+            "import signal\n"
+            "def app_handler(signum, frame): pass\n"
+            "signal.signal(signal.SIGTERM, app_handler)\n"
+            "from miraveja_log.infrastructure.handlers import BufferedFileHandler\n"
+            f"BufferedFileHandler({str(tmp_path / 'app.log')!r}, flush_interval=0, flush_on_sigterm=True)\n"
+            "assert signal.getsignal(signal.SIGTERM) is app_handler\n"
+        )
+
+        subprocess.run([sys.executable, "-c", script], check=True)
+
+    def test_sigterm_handler_is_not_installed_by_default(self, tmp_path: Path) -> None:
+        """Test that a handler that does not opt in leaves SIGTERM alone and is not tracked."""
+        script = (
+            "import signal\n"
+            "from miraveja_log.infrastructure.handlers import BufferedFileHandler\n"
+            f"BufferedFileHandler({str(tmp_path / 'app.log')!r}, flush_interval=0)\n"
+            "assert signal.getsignal(signal.SIGTERM) is signal.SIG_DFL\n"
+        )
+
+        subprocess.run([sys.executable, "-c", script], check=True)
+
+    def test_sigterm_flush_skips_handler_locked_by_another_thread(self, tmp_path: Path) -> None:
+        """Test that the SIGTERM flush does not wait indefinitely for a handler another thread holds."""
+        log_path = tmp_path / "app.log"
+        script = (
+            "import logging, os, signal, threading\n"
+            "from miraveja_log.infrastructure.handlers import BufferedFileHandler, buffered_file_handler\n"
+            "buffered_file_handler._SIGTERM_FLUSH_TIMEOUT = 0.1\n"
+            f"handler = BufferedFileHandler({str(log_path)!r}, flush_interval=0, flush_on_sigterm=True)\n"
+            "handler.emit(logging.LogRecord('test', logging.INFO, 'test.py', 1, 'Locked', (), None))\n"
+            "locked = threading.Event()\n"
+            "def hold_lock():\n"
+            "    handler.acquire()\n"
+            "    locked.set()\n"
+            "    threading.Event().wait()\n"
+            "threading.Thread(target=hold_lock, daemon=True).start()\n"
+            "locked.wait()\n"
+            "os.kill(os.getpid(), signal.SIGTERM)\n"
+        )
+
+        result = subprocess.run([sys.executable, "-c", script], check=False, timeout=30)
+
+        assert result.returncode == -signal.SIGTERM
+
+    def test_closed_handler_is_not_tracked(self, tmp_path: Path) -> None:
+        """Test that closing a handler removes it from the SIGTERM flush set."""
+        handler = BufferedFileHandler(str(tmp_path / "app.log"), flush_interval=0, flush_on_sigterm=True)
+
+        assert handler in buffered_file_handler._live_handlers
+        handler.close()
+        assert handler not in buffered_file_handler._live_handlers
+
+
+class TestBufferedFileHandlerPendingWrites:
+    """Test tracking of records waiting in the buffer."""
+
+    def test_buffered_record_marks_pending_writes(self, tmp_path: Path) -> None:
+        """Test that a record below the flush level leaves pending writes."""
+        handler = BufferedFileHandler(str(tmp_path / "app.log"), flush_interval=0)
+
+        assert handler.has_pending_writes is False
+        handler.emit(_make_record("Buffered message"))
+        assert handler.has_pending_writes is True
+        handler.close()
+
+    def test_flush_clears_pending_writes(self, tmp_path: Path) -> None:
+        """Test that flushing clears the pending writes flag."""
+        handler = BufferedFileHandler(str(tmp_path / "app.log"), flush_interval=0)
+
+        handler.emit(_make_record("Buffered message"))
+        handler.flush()
+
+        assert handler.has_pending_writes is False
+        handler.close()
+
+    def test_severe_record_leaves_no_pending_writes(self, tmp_path: Path) -> None:
+        """Test that records at the flush level are flushed immediately."""
+        handler = BufferedFileHandler(str(tmp_path / "app.log"), flush_interval=0)
+
+        handler.emit(_make_record("Severe message", logging.ERROR))
+
+        assert handler.has_pending_writes is False
+        handler.close()
+
+    def test_idle_handler_is_not_flushed_by_background_thread(self, tmp_path: Path) -> None:
+        """Test that the background flusher skips handlers with nothing buffered."""
+        handler = BufferedFileHandler(str(tmp_path / "app.log"), flush_interval=0.01)
+        flushes: list[None] = []
+        original_flush = handler.flush
+        handler.flush = lambda: (flushes.append(None), original_flush())  # type: ignore[method-assign]
+
+        time.sleep(0.1)
+
+        assert flushes == []
+        handler.close()
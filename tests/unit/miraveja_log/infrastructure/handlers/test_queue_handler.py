@@ -0,0 +1,63 @@
+"""Unit tests for LocalQueueHandler."""
+
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler
+
+from miraveja_log.infrastructure.handlers.queue_handler import LocalQueueHandler
+
+
+class TestLocalQueueHandler:
+    """Test LocalQueueHandler record preparation."""
+
+    def test_local_queue_handler_inherits_from_queue_handler(self) -> None:
+        """Test that LocalQueueHandler is a stdlib QueueHandler."""
+        handler = LocalQueueHandler(queue.SimpleQueue())
+        assert isinstance(handler, QueueHandler)
+
+    def test_prepare_merges_message_arguments(self) -> None:
+        """Test that prepare applies message args and clears them."""
+        handler = LocalQueueHandler(queue.SimpleQueue())
+        record = logging.LogRecord("test", logging.INFO, "test.py", 1, "Value: %s", ("42",), None)
+
+        prepared = handler.prepare(record)
+
+        assert prepared.msg == "Value: 42"
+        assert prepared.args is None
+
+    def test_prepare_does_not_mutate_original_record(self) -> None:
+        """Test that prepare works on a copy of the record."""
+        handler = LocalQueueHandler(queue.SimpleQueue())
+        record = logging.LogRecord("test", logging.INFO, "test.py", 1, "Value: %s", ("42",), None)
+
+        prepared = handler.prepare(record)
+
+        assert prepared is not record
+        assert record.msg == "Value: %s"
+        assert record.args == ("42",)
+
+    def test_prepare_keeps_exception_info(self) -> None:
+        """Test that prepare preserves exc_info for downstream formatters."""
+        handler = LocalQueueHandler(queue.SimpleQueue())
+        try:
+            raise ValueError("Queued error")
+        except ValueError:
+            exc_info = sys.exc_info()
+        record = logging.LogRecord("test", logging.ERROR, "test.py", 1, "Error", (), exc_info)
+
+        prepared = handler.prepare(record)
+
+        assert prepared.exc_info is exc_info
+        assert prepared.msg == "Error"
+
+    def test_emit_puts_record_on_queue(self) -> None:
+        """Test that emitted records end up on the queue."""
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        handler = LocalQueueHandler(log_queue)
+        record = logging.LogRecord("test", logging.INFO, "test.py", 1, "Queued", (), None)
+
+        handler.emit(record)
+
+        queued = log_queue.get_nowait()
+        assert queued.msg == "Queued"
@@ -1,6 +1,8 @@
 """Unit tests for testing utilities."""
 
 import logging
+import threading
+from unittest.mock import patch
 
 import pytest
 
@@ -125,6 +127,91 @@ class TestMemoryHandler:
         assert messages[1] == "Message 1"
         assert messages[2] == "Message 2"
 
+    def test_memory_handler_get_messages_without_formatter_uses_message(self) -> None:
+        """Test that get_messages falls back to the default format when no formatter is set."""
+        handler = MemoryHandler()
+        handler.emit(logging.LogRecord("test", logging.INFO, "test.py", 1, "User %s", ("alice",), None))
+
+        assert handler.get_messages() == ["User alice"]
+
+    def test_memory_handler_get_messages_does_not_call_handler_format(self) -> None:
+        """Test that get_messages formats records with the formatter directly."""
+        handler = MemoryHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler.emit(logging.LogRecord("test", logging.INFO, "test.py", 1, "Message", (), None))
+
+        with patch.object(MemoryHandler, "format") as mock_format:
+            assert handler.get_messages() == ["Message"]
+
+        mock_format.assert_not_called()
+
+    def test_memory_handler_is_unbounded_by_default(self) -> None:
+        """Test that MemoryHandler keeps every record when no capacity is given."""
+        handler = MemoryHandler()
+        for index in range(1000):
+            handler.emit(logging.LogRecord("test", logging.INFO, "test.py", 1, f"Message {index}", (), None))
+
+        assert len(handler.records) == 1000
+
+    def test_memory_handler_unbounded_records_is_a_list(self) -> None:
+        """Test that an unbounded MemoryHandler keeps its records in a list."""
+        handler = MemoryHandler()
+        records = [
+            logging.LogRecord("test", logging.INFO, "test.py", 1, f"Message {index}", (), None) for index in range(3)
+        ]
+        for record in records:
+            handler.emit(record)
+
+        assert isinstance(handler.records, list)
+        assert handler.records == records
+        assert handler.records[-2:] == records[-2:]
+
+    def test_memory_handler_capacity_drops_oldest_records(self) -> None:
+        """Test that a bounded MemoryHandler keeps only the newest records."""
+        handler = MemoryHandler(capacity=2)
+        for index in range(3):
+            handler.emit(logging.LogRecord("test", logging.INFO, "test.py", 1, f"Message {index}", (), None))
+
+        assert [record.getMessage() for record in handler.records] == ["Message 1", "Message 2"]
+
+    def test_memory_handler_handle_does_not_take_lock(self) -> None:
+        """Test that handling a record does not acquire the handler lock."""
+        handler = MemoryHandler()
+
+        with patch.object(handler, "acquire") as mock_acquire:
+            handler.handle(logging.LogRecord("test", logging.INFO, "test.py", 1, "Message", (), None))
+
+        mock_acquire.assert_not_called()
+        assert len(handler.records) == 1
+
+    def test_memory_handler_handle_applies_filters(self) -> None:
+        """Test that records rejected by a filter are not stored."""
+        handler = MemoryHandler()
+        handler.addFilter(lambda record: record.levelno >= logging.WARNING)
+
+        assert not handler.handle(logging.LogRecord("test", logging.INFO, "test.py", 1, "Dropped", (), None))
+        assert handler.handle(logging.LogRecord("test", logging.ERROR, "test.py", 1, "Kept", (), None))
+        assert [record.getMessage() for record in handler.records] == ["Kept"]
+
+    def test_memory_handler_keeps_records_from_concurrent_threads(self) -> None:
+        """Test that records emitted from many threads are all stored."""
+        handler = MemoryHandler()
+        logger = logging.getLogger("test_memory_handler_threads")
+        logger.addHandler(handler)
+
+        def emit_records() -> None:
+            for index in range(100):
+                logger.warning("Message %d", index)
+
+        threads = [threading.Thread(target=emit_records) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logger.removeHandler(handler)
+
+        assert len(handler.records) == 800
+
 
 class TestMockLogger:
     """Test MockLogger functionality."""
@@ -249,6 +336,21 @@ class TestMockLogger:
         assert "Info message 1" in info_messages
         assert "Info message 2" in info_messages
 
+    def test_mock_logger_get_messages_with_mismatched_args_returns_raw_message(self) -> None:
+        """Test that arguments not matching the placeholders leave the message unmerged instead of raising."""
+        logger = MockLogger()
+        logger.info("No placeholders", "extra")
+        logger.info("Two placeholders %s %s", "only one")
+        logger.info("Number %d", "not a number")
+        logger.info("Named %(user)s", {"other": "value"})
+
+        assert logger.get_messages() == [
+            "No placeholders",
+            "Two placeholders %s %s",
+            "Number %d",
+            "Named %(user)s",
+        ]
+
     def test_mock_logger_get_messages_with_nonexistent_level(self) -> None:
         """Test get_messages with a level that has no messages."""
         logger = MockLogger()
@@ -269,3 +371,35 @@ class TestMockLogger:
         assert logger.calls[0][1] == "First"
         assert logger.calls[1][1] == "Second"
         assert logger.calls[2][1] == "Third"
+
+    def test_mock_logger_calls_are_level_message_args_kwargs_tuples(self) -> None:
+        """Test that calls exposes one (level, message, args, kwargs) tuple per call."""
+        logger = MockLogger()
+        logger.warning("Slow %s", "request", extra={"ms": 900})
+
+        assert logger.calls == [("warning", "Slow %s", ("request",), {"extra": {"ms": 900}})]
+
+    def test_mock_logger_get_messages_returns_new_list(self) -> None:
+        """Test that mutating the returned messages does not alter recorded calls."""
+        logger = MockLogger()
+        logger.info("Kept")
+
+        logger.get_messages().clear()
+
+        assert logger.get_messages() == ["Kept"]
+
+    def test_mock_logger_get_messages_merges_args(self) -> None:
+        """Test that get_messages applies %-style arguments like logging does."""
+        logger = MockLogger()
+        logger.info("User %s logged in", "alice")
+        logger.info("Order %(order_id)s shipped", {"order_id": 7})
+        logger.info("100% literal")
+
+        assert logger.get_messages() == ["User alice logged in", "Order 7 shipped", "100% literal"]
+
+    def test_mock_logger_calls_keep_unformatted_message(self) -> None:
+        """Test that recorded calls keep the format string and arguments separately."""
+        logger = MockLogger()
+        logger.info("User %s logged in", "alice")
+
+        assert logger.calls[0][1:3] == ("User %s logged in", ("alice",))
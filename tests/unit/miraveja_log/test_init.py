@@ -0,0 +1,61 @@
+"""Unit tests for package-level lazy exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import miraveja_log
+from miraveja_log import domain
+
+
+def _modules_loaded_after(statement: str) -> set[str]:
+    """Run an import statement in a fresh interpreter and return the loaded module names."""
+    script = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestLazyExports:
+    """Test cases for PEP 562 lazy exports."""
+
+    def test_importing_package_does_not_import_pydantic(self) -> None:
+        """Test that importing the package does not load pydantic or the application layer."""
+        modules = _modules_loaded_after("import miraveja_log")
+
+        assert "pydantic" not in modules
+        assert "miraveja_log.application" not in modules
+
+    def test_importing_factory_does_not_import_pydantic(self) -> None:
+        """Test that sync logger setup does not pay for pydantic."""
+        modules = _modules_loaded_after("from miraveja_log import LoggerConfig, LoggerFactory")
+
+        assert "miraveja_log.application" in modules
+        assert "pydantic" not in modules
+
+    def test_accessing_log_entry_imports_models(self) -> None:
+        """Test that LogEntry is loaded on first access."""
+        modules = _modules_loaded_after("from miraveja_log.domain import LogEntry")
+
+        assert "miraveja_log.domain.models" in modules
+
+    def test_lazy_exports_resolve_to_real_objects(self) -> None:
+        """Test that lazy exports are the same objects as their defining modules export."""
+        from miraveja_log.application import LoggerConfig, LoggerFactory
+        from miraveja_log.domain.models import LogEntry
+
+        assert miraveja_log.LoggerFactory is LoggerFactory
+        assert miraveja_log.LoggerConfig is LoggerConfig
+        assert domain.LogEntry is LogEntry
+
+    def test_lazy_exports_are_listed_in_dir(self) -> None:
+        """Test that lazy exports appear in dir() of their package."""
+        assert {"LoggerFactory", "LoggerConfig"} <= set(dir(miraveja_log))
+        assert "LogEntry" in dir(domain)
+
+    def test_unknown_attribute_raises_attribute_error(self) -> None:
+        """Test that unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            getattr(miraveja_log, "DoesNotExist")
+        with pytest.raises(AttributeError):
+            getattr(domain, "DoesNotExist")